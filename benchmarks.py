@@ -0,0 +1,211 @@
+"""
+Benchmark suite for the headless core (and, when a display is available, the list view).
+
+Measures add/delete throughput, grade statistics, search and rendering cost at
+1k, 10k and 100k items with timeit. Run it with:
+
+    python benchmarks.py                      # all sizes
+    python benchmarks.py --sizes 1000 10000   # a subset
+    python benchmarks.py --save base.json     # keep the results...
+    python benchmarks.py --compare base.json  # ...and flag regressions against them
+"""
+import argparse
+from datetime import date, timedelta
+import json
+import random
+import sys
+import timeit
+
+from scholex_analytics import GradeAnalytics
+from scholex_core import Item, ItemKind, OrganizerCore, Recurrence
+
+SIZES = (1_000, 10_000, 100_000)
+WORDS = ("math", "history", "essay", "physics", "lab", "report", "quiz", "chapter",
+         "reading", "project", "final", "midterm", "homework", "worksheet")
+CATEGORIES = ("Exam", "Project", "Quiz", "Homework", "Lab", "General")
+REGRESSION_THRESHOLD = 1.25 # Flag results more than 25% slower than the baseline
+
+
+def make_items(count, seed=1):
+    """A reproducible mix of assignments, exams and grades."""
+    rng = random.Random(seed)
+    start = date.today() - timedelta(days=60)
+    items = []
+    for index in range(count):
+        name = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {index}"
+        kind = (ItemKind.ASSIGNMENT, ItemKind.EXAM, ItemKind.GRADE)[index % 3]
+        if kind is ItemKind.GRADE:
+            items.append(Item(kind, name, score=round(rng.uniform(40, 100), 2), category=rng.choice(CATEGORIES),
+                              term=f"{rng.choice(('Spring', 'Fall'))} {rng.randrange(2018, 2027)}"))
+        else:
+            items.append(Item(kind, name, due=start + timedelta(days=rng.randrange(240))))
+    return items
+
+
+def make_core(count):
+    core = OrganizerCore() # No storage: measure the in-memory engine only
+    core.add_items(make_items(count))
+    return core
+
+
+def per_op(func, ops=1):
+    """Best time per operation in microseconds (timeit autorange, best of 3)."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    best = min(timer.repeat(repeat=3, number=loops))
+    return best / loops / ops * 1e6
+
+
+def bench_add(size):
+    core = make_core(size)
+    counter = iter(range(10**9))
+
+    def add():
+        core.add("Assignment", f"bench item {next(counter)}", month="5", day="14")
+    return per_op(add)
+
+
+def bench_delete(size):
+    core = make_core(size)
+    batch = 1000
+
+    def delete_and_restore():
+        removed = core.delete([item.id for item in core.collections[ItemKind.ASSIGNMENT].ordered()[:batch]])
+        core.add_items(removed)
+    return per_op(delete_and_restore, ops=2 * batch) # One delete plus one re-add per item
+
+
+def bench_stats(size):
+    stats = make_core(size).grade_stats
+
+    def summary():
+        stats.mean, stats.median, stats.percentile(25), stats.percentile(75), stats.weighted_average()
+    return per_op(summary)
+
+
+def bench_analytics(size):
+    """Full (uncached) recompute of the grade analytics, as after a grade change."""
+    grades = make_core(size).collections[ItemKind.GRADE]
+
+    def recompute():
+        analytics = GradeAnalytics(grades)
+        analytics.weighted_average(), analytics.term_summaries(), analytics.cumulative_gpa()
+        analytics.letter_histogram(), analytics.trend(), analytics.needed_score(85)
+    return per_op(recompute)
+
+
+def bench_calendar(size):
+    """One calendar page (42 days) with 1% of the dated items repeating every 1-14 days."""
+    core = make_core(size)
+    rng = random.Random(2)
+    start = date.today() - timedelta(days=60)
+    core.add_items([Item(ItemKind.ASSIGNMENT, f"series {index}", due=start,
+                         recurrence=Recurrence(rng.randrange(1, 15))) for index in range(size // 100)])
+    page = date.today().replace(day=1)
+
+    def month():
+        core.occurrences_by_date(page, page + timedelta(days=42))
+    return per_op(month)
+
+
+def bench_search(size):
+    core = make_core(size)
+
+    def search():
+        for query in ("ma", "math 1", "quiz report"):
+            for kind in ItemKind:
+                len(core.query(kind, query))
+    return per_op(search, ops=3)
+
+
+def bench_render_rows(size, visible_rows=20):
+    """The display-independent part of drawing a screenful: query plus row texts."""
+    core = make_core(size)
+
+    def render():
+        for kind in ItemKind:
+            items = core.query(kind, sort=True)
+            for index in range(min(visible_rows, len(items))):
+                item = items[index]
+                f"{index + 1}. {item.name} - {item.details}"
+    return per_op(render)
+
+
+def bench_render_widgets(size):
+    """Real VirtualItemList set_items + scroll cost; None when there is no display."""
+    try:
+        import customtkinter as ctk
+        from demoapp import VirtualItemList
+        window = ctk.CTk()
+    except Exception: # No display (or no customtkinter) available
+        return None
+
+    window.geometry("700x500")
+    list_view = VirtualItemList(window, lambda view, command: ctk.CTkButton(view.viewport, text="", height=28, command=command),
+                                lambda item, index: f"{index + 1}. {item.name} - {item.details}", lambda item, additive: None)
+    list_view.pack(fill="both", expand=True)
+    window.update()
+    items = make_core(size).query(ItemKind.ASSIGNMENT, sort=True)
+    position = iter(range(10**9))
+
+    def render():
+        list_view.set_items(items)
+        list_view.scroll_to(next(position) * 7 % max(1, len(items)) * list_view.ROW_HEIGHT)
+        window.update_idletasks()
+    try:
+        return per_op(render)
+    finally:
+        window.destroy()
+
+
+BENCHMARKS = {
+    "add (per item)": bench_add,
+    "delete (per item)": bench_delete,
+    "grade stats summary": bench_stats,
+    "grade analytics (cold)": bench_analytics,
+    "search (per query)": bench_search,
+    "calendar page": bench_calendar,
+    "render rows (query + text)": bench_render_rows,
+    "render widgets (Tk)": bench_render_widgets,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="flag regressions against a JSON file written by --save")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'benchmark':<28}" + "".join(f"{size:>14,}" for size in args.sizes) + "   (µs/op)")
+    for name, bench in BENCHMARKS.items():
+        row = results[name] = {}
+        cells = []
+        for size in args.sizes:
+            value = bench(size)
+            row[str(size)] = value
+            cells.append(f"{value:>14.2f}" if value is not None else f"{'skipped':>14}")
+        print(f"{name:<28}" + "".join(cells))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)
+        for name, row in results.items():
+            for size, value in row.items():
+                before = baseline.get(name, {}).get(size)
+                if value is not None and before and value > before * REGRESSION_THRESHOLD:
+                    regressions.append(f"{name} @ {size}: {before:.2f} -> {value:.2f} µs/op")
+        print("\nRegressions:" if regressions else "\nNo regressions.")
+        for line in regressions:
+            print(f"  {line}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,21 @@
+import time
+_startup_begin = time.perf_counter() # Start of the startup timing report
+
 import customtkinter as ctk
-from datetime import datetime
-import random
-import re # Added for robust grade parsing
+_customtkinter_imported = time.perf_counter()
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import os
+import queue
+import sys
+import threading
+from tkinter import filedialog
+
+from scholex_core import (CATEGORY_WEIGHTS, DEFAULT_PROFILE, Item, ItemKind, OrganizerCore, ProfileManager,
+                          current_term, export_items, iter_item_chunks, make_due_date)
+from scholex_analytics import GradeAnalytics
+from scholex_perf import instrumented, perf
 
 # --- 1. Global Configuration ---
 # Set the default appearance mode to "System" (respects OS theme)
@@ -9,18 +23,558 @@ ctk.set_appearance_mode("System")
 # Set the default color theme to "blue"
 ctk.set_default_color_theme("blue")
 
+# --- Row Styles ---
+# Shared (light, dark) colors for the list rows of each item kind. Every row
+# references these same tuples, so CustomTkinter resolves them for the current
+# appearance mode when drawing and a theme switch just redraws the pooled rows.
+ROW_BORDER_COLOR = ("gray10", "gray90") # Selection outline
+ROW_STYLES = {
+    ItemKind.ASSIGNMENT: {"fg_color": ("gray30", "gray30"), "hover_color": ("gray60", "gray20")},
+    ItemKind.EXAM: {"fg_color": ("darkred", "darkred"), "hover_color": ("firebrick", "#5c0000")},
+    ItemKind.GRADE: {"fg_color": ("darkgreen", "darkgreen"), "hover_color": ("forestgreen", "#004d00")},
+}
+
+# --- Startup Timing ---
+class StartupTimer:
+    """
+    Records how long each startup phase takes, up to time-to-interactive.
+
+    Phases are marked in order; the report is printed to stderr when the app is
+    started with --startup-report (or SCHOLEX_STARTUP_REPORT=1 is set).
+    """
+
+    def __init__(self):
+        self.phases = [("import customtkinter", _customtkinter_imported - _startup_begin)]
+        self._last = time.perf_counter()
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    @property
+    def time_to_interactive(self):
+        return self._last - _startup_begin
+
+    def report(self, item_count):
+        if "--startup-report" not in sys.argv and not os.environ.get("SCHOLEX_STARTUP_REPORT"):
+            return
+        phases = " | ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in self.phases)
+        print(f"Startup ({item_count} items): {phases} | time-to-interactive "
+              f"{self.time_to_interactive * 1000:.1f} ms", file=sys.stderr)
+
+
+# --- Background Tasks ---
+class Task:
+    """Handle for work submitted to a TaskScheduler."""
+
+    def __init__(self, scheduler, key=None):
+        self.scheduler = scheduler
+        self.key = key
+        self.future = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        """True once cancel() was called; long-running work should check this and stop."""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Cancels the task; a result (or post) that arrives afterwards is dropped."""
+        self._cancelled.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def post(self, callback, *args):
+        """Schedules callback(*args) on the Tk thread (safe to call from the worker)."""
+        self.scheduler._results.put((self, callback, args))
+
+
+class TaskScheduler:
+    """
+    Runs work on a thread pool and hands results back on the Tk thread.
+
+    Completed results and Task.post() messages go through a queue that the widget
+    drains with after() while work is outstanding, so callbacks always run on the
+    main loop. Submitting with a key supersedes any pending task with the same key
+    (coalescing repeated requests), and every task can be cancelled.
+    """
+
+    POLL_INTERVAL = 25     # Milliseconds between queue drains
+    DRAIN_BUDGET = 0.010   # Seconds of callbacks per drain before yielding to Tk
+
+    def __init__(self, widget, max_workers=4):
+        self.widget = widget
+        self._threads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scholex")
+        self._results = queue.Queue()
+        self._current = {}     # key -> latest Task submitted with that key
+        self._outstanding = 0  # Tasks whose completion hasn't been delivered yet
+        self._polling = False
+
+    def submit(self, func, *args, key=None, on_done=None, on_error=None, with_task=False):
+        """
+        Runs func(*args) in the background and returns its Task.
+
+        on_done(result) / on_error(exception) run on the Tk thread. With with_task=True
+        the Task is passed as the first argument so func can check task.cancelled and
+        task.post() progress.
+        """
+        task = Task(self, key)
+        if key is not None:
+            previous = self._current.get(key)
+            if previous is not None:
+                previous.cancel()
+            self._current[key] = task
+
+        if with_task:
+            task.future = self._threads.submit(func, task, *args)
+        else:
+            task.future = self._threads.submit(func, *args)
+
+        self._outstanding += 1
+        task.future.add_done_callback(
+            lambda future: self._results.put((task, self._complete, (future, on_done, on_error))))
+        self._ensure_polling()
+        return task
+
+    def shutdown(self):
+        """Cancels everything still pending and stops the pool."""
+        for task in list(self._current.values()):
+            task.cancel()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.POLL_INTERVAL, self._drain)
+
+    def _drain(self):
+        """Runs queued callbacks on the Tk thread, within a small time budget."""
+        deadline = time.perf_counter() + self.DRAIN_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                task, callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if callback == self._complete:
+                callback(task, *args)
+            elif not task.cancelled:
+                callback(*args)
+
+        if self._outstanding or not self._results.empty():
+            self.widget.after(self.POLL_INTERVAL, self._drain)
+        else:
+            self._polling = False
+
+    def _complete(self, task, future, on_done, on_error):
+        self._outstanding -= 1
+        if task.key is not None and self._current.get(task.key) is task:
+            del self._current[task.key]
+        if task.cancelled or future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            if on_done is not None:
+                on_done(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            print(f"Background task failed: {error!r}", file=sys.stderr)
+
+
+# --- Virtual List Widget ---
+class VirtualItemList(ctk.CTkFrame):
+    """
+    A scrollable list that only builds widgets for the rows in view.
+
+    A small pool of row widgets (enough to fill the viewport plus an overscan
+    buffer) is recycled as the user scrolls: item i is always shown by pool slot
+    i % pool size, so scrolling by a row only re-texts the row that came into view.
+    Scrolling and set_items() cost the same for 50 items or 100,000.
+    """
+
+    ROW_HEIGHT = 38 # 28px button + 5px padding above and below
+    ROW_PADDING = 5
+    OVERSCAN = 2 # Extra rows kept ready above and below the viewport
+
+    def __init__(self, master, row_factory, text_func, command, kind=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.kind = kind               # ItemKind shown (selects the row style)
+        self.row_factory = row_factory # Builds one (unplaced) row widget
+        self.text_func = text_func     # (item, index) -> row text
+        self.command = command         # Called with (item, additive) for a clicked row
+
+        self.items = []
+        self.selected_ids = set()  # IDs of the highlighted rows
+        self.rows = []      # Recycled row widget pool
+        self.row_state = [] # (item, text, selected) currently shown by each pool slot
+        self.top = 0        # Scroll offset in (unscaled) pixels
+        self._additive_click = False # Ctrl/Shift held when the last row was pressed
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.grid(row=0, column=0, sticky="nsew", padx=5)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
+
+        self.viewport.bind("<Configure>", lambda event: self._render())
+        if "linux" in sys.platform:
+            self.bind_all("<Button-4>", self._on_mouse_wheel, add=True)
+            self.bind_all("<Button-5>", self._on_mouse_wheel, add=True)
+        else:
+            self.bind_all("<MouseWheel>", self._on_mouse_wheel, add=True)
+
+    def set_items(self, items):
+        """Shows the given list; only the rows in view are (re)configured."""
+        self.items = items
+        self.scroll_to(self.top) # Clamps the offset if the list shrank
+
+    def set_selection(self, selected_ids):
+        """Highlights the rows whose item ID is in selected_ids."""
+        self.selected_ids = selected_ids
+        self._render()
+
+    def scroll_to(self, top):
+        """Scrolls so that the given pixel offset is at the top of the viewport."""
+        max_top = max(0, len(self.items) * self.ROW_HEIGHT - self._viewport_height())
+        self.top = int(max(0, min(top, max_top)))
+        self._render()
+
+    def _viewport_height(self):
+        return self._reverse_widget_scaling(self.viewport.winfo_height())
+
+    def _ensure_pool(self, visible_rows):
+        """Grows the row pool so it can cover the viewport plus overscan."""
+        needed = visible_rows + 1 + 2 * self.OVERSCAN
+        if needed <= len(self.rows):
+            return
+
+        for row_widget in self.rows:
+            row_widget.place_forget()
+        while len(self.rows) < needed:
+            slot = len(self.rows)
+            row_widget = self.row_factory(self, lambda slot=slot: self._on_row_click(slot))
+            # CTkButton only creates its text label once it has text, and bind() only reaches
+            # parts that exist, so give the row placeholder text before binding the press
+            row_widget.configure(text=" ")
+            row_widget.bind("<Button-1>", self._on_row_press)
+            self.rows.append(row_widget)
+        # Slot assignment depends on the pool size, so every row must be re-texted
+        self.row_state = [None] * len(self.rows)
+
+    @instrumented("list render")
+    def _render(self):
+        """Positions the pool rows over the slice of items currently in view."""
+        height = self._viewport_height()
+        self._ensure_pool(height // self.ROW_HEIGHT + 1)
+
+        count = len(self.items)
+        first = max(0, self.top // self.ROW_HEIGHT - self.OVERSCAN)
+        last = min(count, (self.top + height) // self.ROW_HEIGHT + 1 + self.OVERSCAN)
+        pool_size = len(self.rows)
+
+        used_slots = set()
+        for index in range(first, last):
+            slot = index % pool_size
+            used_slots.add(slot)
+            item = self.items[index]
+            item_text = self.text_func(item, index)
+            selected = item.id in self.selected_ids
+
+            state = self.row_state[slot]
+            if state is None or state[0] is not item or state[1] != item_text or state[2] != selected:
+                self.rows[slot].configure(text=item_text, border_width=2 if selected else 0)
+                self.row_state[slot] = (item, item_text, selected)
+            self.rows[slot].place(x=0, y=index * self.ROW_HEIGHT - self.top + self.ROW_PADDING, relwidth=1.0)
+
+        for slot in range(pool_size):
+            if slot not in used_slots and self.row_state[slot] is not None:
+                self.rows[slot].place_forget()
+                self.row_state[slot] = None
+
+        # Keep the scrollbar in step with the virtual content height
+        total = count * self.ROW_HEIGHT
+        if total <= height:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.top / total, (self.top + height) / total)
+
+    def _on_row_press(self, event):
+        # Control (0x4) or Shift (0x1) extends the selection instead of replacing it
+        self._additive_click = bool(event.state & 0x0005)
+
+    def _on_row_click(self, slot):
+        state = self.row_state[slot]
+        if state is not None:
+            self.command(state[0], self._additive_click)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(amount) * len(self.items) * self.ROW_HEIGHT)
+        elif action == "scroll":
+            step = self.ROW_HEIGHT if unit == "units" else self._viewport_height()
+            self.scroll_to(self.top + int(amount) * step)
+
+    def _on_mouse_wheel(self, event):
+        # bind_all delivers every wheel event; only react to those over this list
+        if not str(event.widget).startswith(str(self.viewport)):
+            return
+        if sys.platform.startswith("win"):
+            delta = -int(event.delta / 120)
+        elif sys.platform == "darwin":
+            delta = -event.delta
+        else:
+            delta = -1 if event.num == 4 else 1
+        self.scroll_to(self.top + delta * self.ROW_HEIGHT)
+
+# --- Month Calendar ---
+class MonthCalendar(ctk.CTkFrame):
+    """
+    A month grid of the assignments and exams due on each day.
+
+    The 6x7 day cells are built once and re-texted on every render, and only the
+    42 dates on screen are asked for (recurring items are expanded for that
+    window alone), so memory stays flat however long the schedules run.
+    """
+
+    WEEKS = 6
+    MAX_LINES = 3       # Items listed per day before "+N more"
+    NAME_LENGTH = 18    # Item names are cut to fit the cell
+    DAY_COLOR = ("gray85", "gray20")
+    TODAY_COLOR = ("#c7dcf7", "#1f3a5f")
+
+    def __init__(self, master, fetch, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.fetch = fetch # (start, end) -> {date: [items]} for the dates in [start, end)
+        self.month = date.today().replace(day=1)
+        self.cell_state = [None] * (7 * self.WEEKS) # (text, color) currently shown by each cell
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        header = ctk.CTkFrame(self, fg_color="transparent")
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+        header.grid_columnconfigure(1, weight=1)
+        self.previous_button = ctk.CTkButton(header, text="◀", width=40, command=lambda: self.shift(-1))
+        self.previous_button.grid(row=0, column=0)
+        self.month_label = ctk.CTkLabel(header, text="", font=ctk.CTkFont(size=18, weight="bold"))
+        self.month_label.grid(row=0, column=1)
+        self.today_button = ctk.CTkButton(header, text="Today", width=60,
+                                          command=lambda: self.show_month(date.today().replace(day=1)))
+        self.today_button.grid(row=0, column=2, padx=5)
+        self.next_button = ctk.CTkButton(header, text="▶", width=40, command=lambda: self.shift(1))
+        self.next_button.grid(row=0, column=3)
+
+        grid = ctk.CTkFrame(self, fg_color="transparent")
+        grid.grid(row=1, column=0, sticky="nsew")
+        for column, weekday in enumerate(("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")):
+            grid.grid_columnconfigure(column, weight=1, uniform="day")
+            ctk.CTkLabel(grid, text=weekday, text_color="gray").grid(row=0, column=column)
+        self.cells = []
+        for index in range(7 * self.WEEKS):
+            row, column = divmod(index, 7)
+            grid.grid_rowconfigure(row + 1, weight=1, uniform="week")
+            cell = ctk.CTkLabel(grid, text="", anchor="nw", justify="left", corner_radius=6,
+                                fg_color=self.DAY_COLOR, font=ctk.CTkFont(size=11))
+            cell.grid(row=row + 1, column=column, sticky="nsew", padx=2, pady=2)
+            self.cells.append(cell)
+
+    def shift(self, months):
+        index = self.month.year * 12 + self.month.month - 1 + months
+        self.show_month(date(index // 12, index % 12 + 1, 1))
+
+    def show_month(self, month):
+        self.month = month
+        self.render()
+
+    @instrumented("calendar render")
+    def render(self):
+        """Fills the cells for the shown month (Monday-first, including the edges of adjacent months)."""
+        start = self.month - timedelta(days=self.month.weekday())
+        by_date = self.fetch(start, start + timedelta(days=len(self.cells)))
+        today = date.today()
+        self.month_label.configure(text=self.month.strftime("%B %Y"))
+
+        for index, cell in enumerate(self.cells):
+            day = start + timedelta(days=index)
+            items = by_date.get(day, ())
+            lines = [str(day.day) if day.month == self.month.month else f"{day.month}/{day.day}"]
+            lines.extend(f"{'◆' if item.kind is ItemKind.EXAM else '•'} {item.name[:self.NAME_LENGTH]}"
+                         for item in items[:self.MAX_LINES])
+            if len(items) > self.MAX_LINES:
+                lines.append(f"+{len(items) - self.MAX_LINES} more")
+            state = ("\n".join(lines), self.TODAY_COLOR if day == today else self.DAY_COLOR,
+                     None if day.month == self.month.month else "gray")
+
+            if state != self.cell_state[index]: # Only touch cells whose content changed
+                cell.configure(text=state[0], fg_color=state[1], text_color=state[2] or ("gray10", "gray90"))
+                self.cell_state[index] = state
+
+# --- Performance Overlay ---
+class PerfOverlay(ctk.CTkFrame):
+    """
+    Floating panel with live hot-path timings (p50/p99), event-loop latency,
+    widget counts and memory, plus cProfile/tracemalloc capture and JSON
+    trace export. Toggled with F12 or the sidebar switch; instrumentation is
+    only active while the panel is shown (or the app runs with --perf).
+    """
+
+    REFRESH_MS = 500   # Panel update interval
+    HEARTBEAT_MS = 100 # Event-loop latency probe interval
+
+    def __init__(self, app):
+        super().__init__(app, corner_radius=10, border_width=1)
+        self.app = app
+        self.always_on = "--perf" in sys.argv or bool(os.environ.get("SCHOLEX_PERF"))
+        self.shown = False
+        self._refresh_after_id = None
+        self._heartbeat_after_id = None
+
+        self.stats_label = ctk.CTkLabel(self, text="", justify="left", anchor="w",
+                                        font=ctk.CTkFont(family="Courier", size=12))
+        self.stats_label.grid(row=0, column=0, columnspan=4, padx=10, pady=(10, 5), sticky="w")
+
+        self.profile_button = ctk.CTkButton(self, text="Profile", width=80, command=self.toggle_profiling)
+        self.profile_button.grid(row=1, column=0, padx=(10, 5), pady=(0, 10))
+        self.memory_button = ctk.CTkButton(self, text="Track memory", width=100, command=self.toggle_memory)
+        self.memory_button.grid(row=1, column=1, padx=5, pady=(0, 10))
+        self.reset_button = ctk.CTkButton(self, text="Reset", width=60, command=perf.reset)
+        self.reset_button.grid(row=1, column=2, padx=5, pady=(0, 10))
+        self.export_button = ctk.CTkButton(self, text="Export trace...", width=100, command=self.export_trace)
+        self.export_button.grid(row=1, column=3, padx=(5, 10), pady=(0, 10))
+
+        if self.always_on:
+            self.start_probes()
+
+    def toggle(self):
+        self.shown = not self.shown
+        if not self.shown:
+            self.place_forget()
+            if not self.always_on:
+                self.stop_probes()
+            if self._refresh_after_id is not None:
+                self.after_cancel(self._refresh_after_id)
+                self._refresh_after_id = None
+        else:
+            self.start_probes()
+            self.place(relx=1.0, x=-30, y=30, anchor="ne")
+            self.lift()
+            self._refresh()
+
+    def start_probes(self):
+        perf.enabled = True
+        if self._heartbeat_after_id is None:
+            self._schedule_heartbeat()
+
+    def stop_probes(self):
+        perf.enabled = False
+        if self._heartbeat_after_id is not None:
+            self.after_cancel(self._heartbeat_after_id)
+            self._heartbeat_after_id = None
+
+    def _schedule_heartbeat(self):
+        scheduled = time.perf_counter_ns()
+        self._heartbeat_after_id = self.after(self.HEARTBEAT_MS, self._heartbeat, scheduled)
+
+    def _heartbeat(self, scheduled):
+        # Anything past the requested delay is time the loop spent busy elsewhere
+        perf.record("event loop latency", scheduled + self.HEARTBEAT_MS * 1_000_000, time.perf_counter_ns())
+        self._schedule_heartbeat()
+
+    def _count_widgets(self):
+        count, pending = 0, [self.app]
+        while pending:
+            children = pending.pop().winfo_children()
+            count += len(children)
+            pending.extend(children)
+        return count
+
+    def _refresh(self):
+        lines = [f"{'probe':<22}{'calls':>8}{'p50 ms':>9}{'p99 ms':>9}"]
+        for name, row in sorted(perf.summary().items()):
+            lines.append(f"{name:<22.22}{row['count']:>8}{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}")
+        if len(lines) == 1:
+            lines.append("(no samples yet)")
+
+        pooled_rows = sum(len(list_view.rows) for list_view in self.app.list_views.values())
+        lines.append(f"\nWidgets: {self._count_widgets()} (list rows pooled: {pooled_rows}), "
+                     f"items: {sum(len(collection) for collection in self.app.collections.values())}")
+        memory = perf.memory()
+        if memory is None:
+            lines.append("Memory: enable 'Track memory' (tracemalloc)")
+        else:
+            lines.append(f"Memory: {memory['current_bytes'] / 2**20:.1f} MiB "
+                         f"(peak {memory['peak_bytes'] / 2**20:.1f} MiB)")
+        if perf.profiling:
+            lines.append("cProfile: recording...")
+
+        self.stats_label.configure(text="\n".join(lines))
+        self._refresh_after_id = self.after(self.REFRESH_MS, self._refresh)
+
+    def toggle_profiling(self):
+        """Starts cProfile, or stops it and prints the top functions to stderr."""
+        if perf.profiling:
+            print(perf.stop_profiling(), file=sys.stderr)
+            self.profile_button.configure(text="Profile")
+            self.app.update_output("Profile written to stderr.")
+        else:
+            perf.start_profiling()
+            self.profile_button.configure(text="Stop profile")
+
+    def toggle_memory(self):
+        if perf.tracking_memory:
+            perf.stop_memory_tracking()
+            self.memory_button.configure(text="Track memory")
+        else:
+            perf.start_memory_tracking()
+            self.memory_button.configure(text="Stop memory")
+
+    def export_trace(self):
+        path = filedialog.asksaveasfilename(title="Export performance trace", defaultextension=".json",
+                                            filetypes=[("Trace JSON", "*.json")])
+        if not path:
+            return
+        try:
+            count = perf.export_trace(path, extra={"widgets": self._count_widgets()})
+        except OSError as error:
+            self.app.update_output(f"Trace export failed: {error}", "red")
+            return
+        self.app.update_output(f"Exported {count} trace events.")
+
 # --- 2. Application Class ---
 class StudentOrganizerApp(ctk.CTk):
+    SEARCH_DEBOUNCE_MS = 120 # Idle time after the last keystroke before filtering
+    STORAGE_CHECK_MS = 1000  # How often background save errors are looked for
+
     def __init__(self):
+        self.startup_timer = StartupTimer()
         super().__init__()
 
-        # Initial data lists
-        self.assignments = []
-        self.exams = []
-        self.grades = []
+        # One headless core (validation, indexes, stats, storage) per student profile;
+        # an empty in-memory one stands in until the first profile has loaded
+        self.profiles = ProfileManager()
+        self._bind_core(OrganizerCore())
 
+        # Selected items by ID (Ctrl/Shift-click selects several of one kind);
+        # currently_selected_item is the one most recently clicked.
+        self.selected_items = {}
         self.currently_selected_item = None
 
+        # Worker pool for long operations; results come back through the Tk loop
+        self.scheduler = TaskScheduler(self)
+        self._import_state = None
+
+        # Profile whose load was requested last
+        self._pending_profile = None
+        self._loading_profiles = set() # Profiles with a load in flight
+
+        # Active search text and the pending debounce callback
+        self.search_query = ""
+        self._search_after_id = None
+
         # --- 3. Window Setup ---
         self.title("Student Organization Tool")
         self.geometry("900x600")
@@ -38,7 +592,7 @@ class StudentOrganizerApp(ctk.CTk):
         self.sidebar_frame.grid(row=0, column=0, padx=20, pady=20, sticky="nsew")
         
         # Spacer row updated
-        self.sidebar_frame.grid_rowconfigure(11, weight=1) 
+        self.sidebar_frame.grid_rowconfigure(13, weight=1) 
         self.sidebar_frame.grid_columnconfigure(0, weight=1) # Ensure widgets stretch horizontally
 
         # User Name Section
@@ -47,8 +601,16 @@ class StudentOrganizerApp(ctk.CTk):
         self.name_label.grid(row=0, column=0, padx=20, pady=(20, 10))
         self.name_entry = ctk.CTkEntry(self.sidebar_frame, placeholder_text="Enter your name...")
         self.name_entry.grid(row=1, column=0, padx=20, pady=5, sticky="ew")
-        self.name_button = ctk.CTkButton(self.sidebar_frame, text="Set Name", command=self.set_name)
-        self.name_button.grid(row=2, column=0, padx=20, pady=5, sticky="ew")
+        # Set Name opens (or creates) that student's profile; the menu switches between profiles
+        self.profile_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
+        self.profile_frame.grid(row=2, column=0, padx=20, pady=5, sticky="ew")
+        self.profile_frame.grid_columnconfigure(0, weight=1)
+        self.profile_frame.grid_columnconfigure(1, weight=1)
+        self.name_button = ctk.CTkButton(self.profile_frame, text="Set Name", command=self.set_name)
+        self.name_button.grid(row=0, column=0, padx=(0, 5), sticky="ew")
+        self.profile_menu = ctk.CTkOptionMenu(self.profile_frame, values=[DEFAULT_PROFILE],
+                                              command=self.switch_profile)
+        self.profile_menu.grid(row=0, column=1, padx=(5, 0), sticky="ew")
         self.output_label = ctk.CTkLabel(self.sidebar_frame, text="", text_color="gray", anchor="w")
         self.output_label.grid(row=3, column=0, padx=20, pady=5, sticky="ew")
 
@@ -77,9 +639,14 @@ class StudentOrganizerApp(ctk.CTk):
         # 7.1 Date Inputs (for Assignment/Exam)
         self.month_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Month (1-12)")
         self.day_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Day (1-31)")
+        self.repeat_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Repeat every N days")
+        self.until_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Until (MM/DD)")
 
         # 7.2 Score Input (for Grade)
         self.score_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Score (0-100)")
+        self.category_combobox = ctk.CTkComboBox(self.item_detail_frame, values=list(CATEGORY_WEIGHTS))
+        self.category_combobox.set("General")
+        self.term_entry = ctk.CTkEntry(self.item_detail_frame, placeholder_text="Term (blank: current term)")
         
         # Action Buttons (Rows adjusted)
         self.add_button = ctk.CTkButton(self.sidebar_frame, text="✅ Add Item", command=self.add_item_wrapper)
@@ -91,69 +658,320 @@ class StudentOrganizerApp(ctk.CTk):
         self.delete_button = ctk.CTkButton(self.sidebar_frame, text="🗑️ Delete Item", fg_color="red", hover_color="darkred", command=self.delete_item_wrapper)
         self.delete_button.grid(row=10, column=0, padx=20, pady=5, sticky="ew")
 
+        # Undo/Redo and Bulk Import/Export (Row 11)
+        self.io_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
+        self.io_frame.grid(row=11, column=0, padx=20, pady=5, sticky="ew")
+        self.io_frame.grid_columnconfigure(0, weight=1)
+        self.io_frame.grid_columnconfigure(1, weight=1)
+
+        self.undo_button = ctk.CTkButton(self.io_frame, text="↶ Undo", command=self.undo_wrapper)
+        self.undo_button.grid(row=0, column=0, padx=(0, 5), pady=(0, 10), sticky="ew")
+        self.redo_button = ctk.CTkButton(self.io_frame, text="↷ Redo", command=self.redo_wrapper)
+        self.redo_button.grid(row=0, column=1, padx=(5, 0), pady=(0, 10), sticky="ew")
+
+        self.import_button = ctk.CTkButton(self.io_frame, text="📥 Import...", command=self.import_items_wrapper)
+        self.import_button.grid(row=1, column=0, padx=(0, 5), sticky="ew")
+        self.export_button = ctk.CTkButton(self.io_frame, text="📤 Export...", command=self.export_items_wrapper)
+        self.export_button.grid(row=1, column=1, padx=(5, 0), sticky="ew")
+        self.import_progress = ctk.CTkProgressBar(self.io_frame) # Only shown while importing
+
+        # Search Box (Row 12): filters all three tabs as you type
+        self.search_entry = ctk.CTkEntry(self.sidebar_frame, placeholder_text="🔍 Search all tabs...")
+        self.search_entry.grid(row=12, column=0, padx=20, pady=(15, 5), sticky="ew")
+        self.search_entry.bind("<KeyRelease>", self.on_search_changed)
+
         # Appearance Switch Section (Rows adjusted)
         self.appearance_switch_label = ctk.CTkLabel(self.sidebar_frame, text="Appearance", anchor="w")
-        self.appearance_switch_label.grid(row=12, column=0, padx=20, pady=(10, 0), sticky="s")
+        self.appearance_switch_label.grid(row=14, column=0, padx=20, pady=(10, 0), sticky="s")
 
         self.appearance_mode_switch = ctk.CTkSwitch(self.sidebar_frame, text="Theme",
                                                     command=self.change_appearance_mode_event)
-        self.appearance_mode_switch.grid(row=13, column=0, padx=20, pady=(0, 20), sticky="s")
+        self.appearance_mode_switch.grid(row=15, column=0, padx=20, pady=(0, 5), sticky="s")
         # Initialize switch position
         if ctk.get_appearance_mode() == "Dark":
             self.appearance_mode_switch.select()
         else:
-             pass 
+             pass
+
+        # Performance overlay toggle (Row 16, also F12)
+        self.perf_switch = ctk.CTkSwitch(self.sidebar_frame, text="Perf overlay", command=self.toggle_perf_overlay)
+        self.perf_switch.grid(row=16, column=0, padx=20, pady=(0, 20), sticky="s")
 
 
         # --- 5. Main Content Area (Tab View) ---
-        self.tab_view = ctk.CTkTabview(self, corner_radius=10)
+        # Tab contents are built the first time each tab is shown (see _ensure_tab_built)
+        self.tab_view = ctk.CTkTabview(self, corner_radius=10, command=self.on_tab_changed)
         self.tab_view.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
 
         # Create tabs for each category
         self.assignments_tab = self.tab_view.add("Assignments")
         self.exams_tab = self.tab_view.add("Exams")
         self.grades_tab = self.tab_view.add("Grades")
+        self.calendar_tab = self.tab_view.add("Calendar")
+        self.calendar_view = None # Built on first visit
 
-        # Configure Assignment and Exams tab layouts
-        for tab in [self.assignments_tab, self.exams_tab]:
-            tab.grid_columnconfigure(0, weight=1)
-            tab.grid_rowconfigure(0, weight=1)
-            
-        # --- Grades Tab Specific Layout (New for average display) ---
-        self.grades_tab.grid_columnconfigure(0, weight=1)
-        self.grades_tab.grid_rowconfigure(0, weight=0) # Average row
-        self.grades_tab.grid_rowconfigure(1, weight=1) # List row
-
-        # 5.1 Grade Average Display
-        self.average_frame = ctk.CTkFrame(self.grades_tab, fg_color="transparent")
-        self.average_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
-        self.average_frame.grid_columnconfigure(0, weight=1)
-
-        self.average_label = ctk.CTkLabel(self.average_frame, text="Current Average Grade: N/A",
-                                  font=ctk.CTkFont(size=18, weight="bold"))
-        self.average_label.grid(row=0, column=0, sticky="w")
-            
-        # 5.2 Scrollable Grades List Frame (Row 1)
-        self.grade_list_frame = ctk.CTkScrollableFrame(self.grades_tab)
-        self.grade_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(5, 10))
-        self.grade_list_frame.grid_columnconfigure(0, weight=1)
-        
-        # --- Assignment and Exam Scrollable Frames ---
-        self.assignment_list_frame = ctk.CTkScrollableFrame(self.assignments_tab)
-        self.assignment_list_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        self.assignment_list_frame.grid_columnconfigure(0, weight=1)
-
-        self.exam_list_frame = ctk.CTkScrollableFrame(self.exams_tab)
-        self.exam_list_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
-        self.exam_list_frame.grid_columnconfigure(0, weight=1)
+        # Built list views by kind, and the per-kind date view settings
+        # (filter is "All", "Upcoming" or "Overdue")
+        self.list_views = {}
+        self.date_views = {kind: {"filter": "All", "days": 7, "sort": False}
+                           for kind in (ItemKind.ASSIGNMENT, ItemKind.EXAM)}
+        self._ensure_tab_built(self.tab_view.get())
         
         # Initial call to set default input fields
         self.update_input_fields(self.item_type_var.get())
-        
-        # Initialize lists with dummy data
-        self.add_dummy_data()
-        
-    # --- 6. Core Logic and Functionality ---
+
+        # Editing waits until the stored items are loaded (their IDs must come first)
+        self.items_loaded = False
+        self.set_editing_enabled(False)
+        self.update_output("Loading items...")
+        self._load_bind_id = self.bind("<Map>", self._on_first_map, add="+")
+
+        # Keyboard shortcuts for undo/redo
+        self.bind("<Control-z>", lambda event: self.undo_wrapper())
+        self.bind("<Control-y>", lambda event: self.redo_wrapper())
+        self.bind("<Control-Z>", lambda event: self.redo_wrapper()) # Ctrl+Shift+Z
+
+        # Opt-in hot-path instrumentation (hidden until toggled)
+        self.perf_overlay = PerfOverlay(self)
+        self.bind("<F12>", lambda event: self.toggle_perf_overlay(from_key=True))
+
+        # Make sure pending writes reach the disk before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.startup_timer.mark("widget build")
+
+    def _ensure_tab_built(self, tab_name):
+        """Builds a tab's widgets on first use and fills its list."""
+        if tab_name == "Calendar":
+            if self.calendar_view is None:
+                self.calendar_tab.grid_columnconfigure(0, weight=1)
+                self.calendar_tab.grid_rowconfigure(0, weight=1)
+                # Looks up self.core on every render, so it follows profile switches
+                self.calendar_view = MonthCalendar(self.calendar_tab,
+                                                   lambda start, end: self.core.occurrences_by_date(start, end))
+                self.calendar_view.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+                self.calendar_view.render()
+            return
+
+        kind = ItemKind(tab_name[:-1]) # "Assignments" -> ItemKind.ASSIGNMENT
+        if kind in self.list_views:
+            return
+
+        if kind is ItemKind.GRADE:
+            # --- Grades Tab Specific Layout (New for average display) ---
+            self.grades_tab.grid_columnconfigure(0, weight=1)
+            self.grades_tab.grid_rowconfigure(0, weight=0) # Average row
+            self.grades_tab.grid_rowconfigure(1, weight=1) # List row
+
+            # 5.1 Grade Average Display
+            self.average_frame = ctk.CTkFrame(self.grades_tab, fg_color="transparent")
+            self.average_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 5))
+            self.average_frame.grid_columnconfigure(0, weight=1)
+
+            self.average_label = ctk.CTkLabel(self.average_frame, text="Current Average Grade: N/A",
+                                      font=ctk.CTkFont(size=18, weight="bold"))
+            self.average_label.grid(row=0, column=0, sticky="w")
+
+            self.stats_label = ctk.CTkLabel(self.average_frame, text="", text_color="gray", anchor="w", justify="left")
+            self.stats_label.grid(row=1, column=0, sticky="w")
+
+            # "What do I need on the final?" solver
+            self.solver_frame = ctk.CTkFrame(self.average_frame, fg_color="transparent")
+            self.solver_frame.grid(row=2, column=0, sticky="w", pady=(5, 0))
+            self.target_entry = ctk.CTkEntry(self.solver_frame, width=110, placeholder_text="Target %")
+            self.target_entry.grid(row=0, column=0, padx=(0, 5))
+            self.final_category_combobox = ctk.CTkComboBox(self.solver_frame, width=120, values=list(CATEGORY_WEIGHTS))
+            self.final_category_combobox.set("Exam")
+            self.final_category_combobox.grid(row=0, column=1, padx=5)
+            self.solve_button = ctk.CTkButton(self.solver_frame, text="Needed on final", width=120,
+                                              command=self.solve_needed_score)
+            self.solve_button.grid(row=0, column=2, padx=5)
+
+            # 5.2 Virtual Grades List (Row 1)
+            self.grade_list_frame = list_view = VirtualItemList(self.grades_tab, self.create_item_widget,
+                                                                self._item_text, self.select_item, kind=kind)
+            self.grade_list_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=(5, 10))
+        else:
+            # Assignment and Exam tabs: date filter toolbar (Row 0) above the list (Row 1)
+            tab = self.assignments_tab if kind is ItemKind.ASSIGNMENT else self.exams_tab
+            tab.grid_columnconfigure(0, weight=1)
+            tab.grid_rowconfigure(0, weight=0) # Date filter toolbar row
+            tab.grid_rowconfigure(1, weight=1) # List row
+            self._build_date_toolbar(tab, kind)
+
+            list_view = VirtualItemList(tab, self.create_item_widget, self._item_text, self.select_item, kind=kind)
+            list_view.grid(row=1, column=0, sticky="nsew", padx=10, pady=(5, 10))
+            if kind is ItemKind.ASSIGNMENT:
+                self.assignment_list_frame = list_view
+            else:
+                self.exam_list_frame = list_view
+
+        self.list_views[kind] = list_view
+        self.refresh_lists(self.collections[kind])
+
+    def on_tab_changed(self):
+        """Builds the newly shown tab if this is its first appearance."""
+        self._ensure_tab_built(self.tab_view.get())
+
+    def show_tab(self, tab_name):
+        """Switches to a tab from code (building it if needed)."""
+        self.tab_view.set(tab_name)
+        self._ensure_tab_built(tab_name)
+
+    def set_editing_enabled(self, enabled):
+        """Enables or disables the buttons that change data."""
+        state = "normal" if enabled else "disabled"
+        for button in (self.add_button, self.modify_button, self.delete_button, self.import_button,
+                       self.undo_button, self.redo_button):
+            button.configure(state=state)
+
+    def _on_first_map(self, event=None):
+        """Once the window is on screen, loads the default profile on a worker thread."""
+        if event is not None and event.widget is not self:
+            return # Child widgets share the root's bindings; wait for the window itself
+        self.unbind("<Map>", self._load_bind_id)
+        self.update_idletasks()
+        self.startup_timer.mark("first paint")
+        self.profile_menu.configure(values=self.profiles.names())
+        self.switch_profile(DEFAULT_PROFILE, first_launch=True)
+        self.after(self.STORAGE_CHECK_MS, self._check_storage)
+
+    def _check_storage(self):
+        """Shows (once) any error the background writers of the open profiles ran into."""
+        for name, core in list(self.profiles.loaded.items()):
+            if core.storage is not None and core.storage.error is not None:
+                self.update_output(f"Could not save {name}'s changes: {core.storage.error}", "red")
+                core.storage.error = None
+        self.after(self.STORAGE_CHECK_MS, self._check_storage)
+
+    def _bind_core(self, core):
+        """Points the app (collections, analytics) at a profile's core."""
+        self.core = core
+        self.collections = core.collections
+        self.assignments = self.collections[ItemKind.ASSIGNMENT]
+        self.exams = self.collections[ItemKind.EXAM]
+        self.grades = self.collections[ItemKind.GRADE]
+        # Weighted/term/letter/trend results, cached until the grades change
+        self.analytics = GradeAnalytics(self.grades)
+
+    def switch_profile(self, name, first_launch=False):
+        """Shows a student's profile, loading its database on a worker thread if needed."""
+        if self._import_state is not None:
+            self.update_output("Wait for the current import to finish.", "red")
+            self.profile_menu.set(self.profiles.active or DEFAULT_PROFILE)
+            return
+
+        self._pending_profile = name # A slower load of an earlier pick must not win
+        if name in self.profiles.loaded:
+            self._show_profile(name)
+            return
+
+        self.items_loaded = False
+        self.set_editing_enabled(False)
+        self.update_output(f"Loading {name}...")
+        if name in self._loading_profiles:
+            return # Its load is already running and will show it (a second one would share its journal)
+        self._loading_profiles.add(name)
+        self.scheduler.submit(self.profiles.load, name,
+                              on_done=lambda core: self._on_profile_loaded(name, core, first_launch),
+                              on_error=lambda error: self._on_load_failed(name, error))
+
+    def _on_profile_loaded(self, name, core, first_launch=False):
+        self._loading_profiles.discard(name)
+        self.profiles.add(name, core)
+        if self._pending_profile == name:
+            self._show_profile(name, first_launch)
+        # Otherwise the user already picked another profile; this one stays cached
+
+    def _show_profile(self, name, first_launch=False):
+        """Makes a loaded profile the active one (seeding dummy data on the very first launch)."""
+        core = self.profiles.activate(name)
+        self._bind_core(core)
+        self.clear_selection()
+
+        self.name_label.configure(text=f"Hello, {name}!")
+        self.profile_menu.configure(values=self.profiles.names())
+        self.profile_menu.set(name)
+        if first_launch and not len(core):
+            self.add_dummy_data()
+            self.update_output("")
+        else:
+            self.refresh_lists()
+            self.update_output(f"Loaded {name}: {len(core)} items.")
+        if core.storage is not None and core.storage.recovered:
+            # The previous session ended without closing; its journal was replayed
+            self.update_output(f"Recovered {core.storage.recovered} unsaved changes for {name}.")
+            core.storage.recovered = 0
+
+        self.items_loaded = True
+        self.set_editing_enabled(True)
+        if first_launch:
+            self.startup_timer.mark("data load")
+            self.startup_timer.report(len(core))
+
+    def _on_load_failed(self, name, error):
+        self._loading_profiles.discard(name)
+        self.update_output(f"Could not load {name}'s stored items: {error}", "red")
+        if self._pending_profile != name:
+            return # The user already picked another profile
+        if self.profiles.active is None:
+            # Only the storage-less placeholder core is bound; edits to it would be lost
+            return
+        self._pending_profile = self.profiles.active
+        self.profile_menu.set(self.profiles.active)
+        self.items_loaded = True
+        self.set_editing_enabled(True)
+
+    def _build_date_toolbar(self, tab, kind):
+        """Builds the All/Upcoming/Overdue filter and sort-by-date controls of a dated tab."""
+        toolbar = ctk.CTkFrame(tab, fg_color="transparent")
+        toolbar.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+
+        filter_button = ctk.CTkSegmentedButton(toolbar, values=["All", "Upcoming", "Overdue"],
+                                               command=lambda value: self.set_date_view(kind, filter=value))
+        filter_button.set("All")
+        filter_button.grid(row=0, column=0, padx=(0, 10))
+
+        days_menu = ctk.CTkOptionMenu(toolbar, values=["3", "7", "14", "30"], width=60,
+                                      command=lambda value: self.set_date_view(kind, days=int(value)))
+        days_menu.set("7")
+        days_menu.grid(row=0, column=1)
+        days_label = ctk.CTkLabel(toolbar, text="days ahead")
+        days_label.grid(row=0, column=2, padx=(5, 10))
+
+        sort_switch = ctk.CTkSwitch(toolbar, text="Sort by date")
+        sort_switch.configure(command=lambda: self.set_date_view(kind, sort=bool(sort_switch.get())))
+        sort_switch.grid(row=0, column=3)
+
+    def set_date_view(self, kind, **settings):
+        """Updates a dated tab's filter/sort settings and re-renders that tab only."""
+        self.date_views[kind].update(settings)
+        self.refresh_lists(self.collections[kind])
+
+    def on_search_changed(self, event=None):
+        """Debounces search keystrokes: the filter runs once typing pauses."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self.apply_search)
+
+    def apply_search(self):
+        """Filters all three tabs down to the items matching the search box."""
+        self._search_after_id = None
+        query = self.search_entry.get().strip()
+        if query == self.search_query:
+            return
+        self.search_query = query
+        self.refresh_lists(self.assignments, self.exams, self.grades)
+        if query:
+            counts = ", ".join(
+                f"{len(self.list_views[kind].items) if kind in self.list_views else len(self.visible_items(collection))} "
+                f"{kind.value.lower()}s" for kind, collection in self.collections.items())
+            self.update_output(f"Search: {counts}")
+        else:
+            self.update_output("Search cleared.")
+
+    def visible_items(self, collection):
+        """The sequence a list view should display for a collection, per its view and search settings."""
+        return self.core.query(collection.kind, self.search_query, **self.date_views.get(collection.kind, {}))
 
     def update_input_fields(self, selected_type):
         """Swaps the detail input fields based on the selected item type."""
@@ -166,18 +984,21 @@ class StudentOrganizerApp(ctk.CTk):
             # Use Date Inputs (Month and Day)
             self.month_entry.grid(row=0, column=0, padx=(0, 5), sticky="ew")
             self.day_entry.grid(row=0, column=1, padx=(5, 0), sticky="ew")
+            self.repeat_entry.grid(row=1, column=0, padx=(0, 5), pady=(5, 0), sticky="ew")
+            self.until_entry.grid(row=1, column=1, padx=(5, 0), pady=(5, 0), sticky="ew")
         elif selected_type == "Grade":
-            # Use single Score Input
-            self.score_entry.grid(row=0, column=0, columnspan=2, sticky="ew")
+            # Use Score Input and Category selector
+            self.score_entry.grid(row=0, column=0, padx=(0, 5), sticky="ew")
+            self.category_combobox.grid(row=0, column=1, padx=(5, 0), sticky="ew")
+            self.term_entry.grid(row=1, column=0, columnspan=2, pady=(5, 0), sticky="ew")
 
 
     def set_name(self):
-        """Updates the greeting label with the user's name."""
+        """Switches to the profile with the entered name (creating it if it is new)."""
         name = self.name_entry.get().strip()
         if name:
-            self.name_label.configure(text=f"Hello, {name}!")
             self.name_entry.delete(0, 'end')
-            self.update_output("Name updated successfully! 👋")
+            self.switch_profile(name)
         else:
             self.update_output("Please enter a name.", "red")
 
@@ -185,288 +1006,288 @@ class StudentOrganizerApp(ctk.CTk):
         """Utility method to update the output status label."""
         self.output_label.configure(text=message, text_color=color)
 
-    def get_current_data(self):
-        """Returns the data list and frame for the currently active tab."""
-        current_tab = self.tab_view.get()
-        if current_tab == "Assignments":
-            return self.assignments, self.assignment_list_frame
-        elif current_tab == "Exams":
-            return self.exams, self.exam_list_frame
-        elif current_tab == "Grades":
-            return self.grades, self.grade_list_frame
-
+    @instrumented("add_item_wrapper")
     def add_item_wrapper(self):
         """A wrapper function to handle adding an item based on the selected type."""
         item_type = self.item_type_var.get() # Get selected type
-        item_name = self.item_entry.get().strip()
-        
-        if not item_name:
-            self.update_output("Item name cannot be empty.", "red")
-            return
-
-        new_item = {"name": item_name, "details": ""}
-        item_detail = ""
 
-        # --- Date/Grade Validation based on Type ---
-        if item_type in ["Assignment", "Exam"]:
-            month_str = self.month_entry.get().strip()
-            day_str = self.day_entry.get().strip()
-            
-            try:
-                month = int(month_str)
-                day = int(day_str)
-                
-                # Basic validation for month/day using if statement
-                if not (1 <= month <= 12 and 1 <= day <= 31):
-                    self.update_output("Date validation failed: Month (1-12) or Day (1-31) is invalid.", "red")
-                    return
-                
-                # Format the date for display and storage (MM/DD)
-                item_detail = f"Due: {month:02d}/{day:02d}"
-
-            except ValueError:
-                self.update_output("Date input must be valid numbers for Month and Day.", "red")
-                return
-
-        elif item_type == "Grade":
-            score_str = self.score_entry.get().strip()
-            try:
-                score = float(score_str)
-                # Use an if statement to check the score range
-                if not (0.0 <= score <= 100.0):
-                    self.update_output("Grade must be a number between 0 and 100.", "red")
-                    return
-                # Store the score as a clean, two-decimal-place string
-                item_detail = f"{score:.2f}%" 
-            except ValueError:
-                self.update_output("Grades must be entered as a number (0-100).", "red")
-                return
-        # --------------------------------------------------------
-        
-        new_item["details"] = item_detail
-
-        # Using if/elif/else to direct item to the correct list based on Combobox selection
-        if item_type == "Assignment":
-            self.assignments.append(new_item)
-            self.tab_view.set("Assignments")
-        elif item_type == "Exam":
-            self.exams.append(new_item)
-            self.tab_view.set("Exams")
-        elif item_type == "Grade":
-            self.grades.append(new_item)
-            self.tab_view.set("Grades")
-        else:
-            self.update_output("Invalid item type selected.", "red")
-            return 
+        # Validation and storage happen in the core; errors come back as ValueError
+        try:
+            new_item = self.core.add(item_type, self.item_entry.get(),
+                                     month=self.month_entry.get(), day=self.day_entry.get(),
+                                     repeat=self.repeat_entry.get(), until=self.until_entry.get(),
+                                     score=self.score_entry.get(), category=self.category_combobox.get(),
+                                     term=self.term_entry.get())
+        except ValueError as error:
+            self.update_output(str(error), "red")
+            return
 
+        self.show_tab(f"{new_item.kind.value}s")
         self.item_entry.delete(0, 'end')
         self.month_entry.delete(0, 'end')
         self.day_entry.delete(0, 'end')
+        self.repeat_entry.delete(0, 'end')
+        self.until_entry.delete(0, 'end')
         self.score_entry.delete(0, 'end')
-        self.refresh_lists()
-        self.update_output(f"Added new {item_type}: {item_name}.")
+        self.term_entry.delete(0, 'end')
+        self.refresh_lists(self.collections[new_item.kind])
+        self.update_output(f"Added new {item_type}: {new_item.name}.")
 
+    @instrumented("modify_item_wrapper")
     def modify_item_wrapper(self):
-        """A wrapper function to handle modifying a selected item."""
-        if self.currently_selected_item is None:
+        """A wrapper function to handle modifying the selected item(s)."""
+        if not self.selected_items:
             self.update_output("Select an item to modify first.", "red")
             return
 
-        item_name = self.item_entry.get().strip()
-        
-        if not item_name and not self.month_entry.get().strip() and not self.day_entry.get().strip() and not self.score_entry.get().strip():
-            self.update_output("Enter new values to modify the item.", "red")
+        try:
+            modified = self.core.modify(list(self.selected_items), name=self.item_entry.get(),
+                                        month=self.month_entry.get(), day=self.day_entry.get(),
+                                        repeat=self.repeat_entry.get(), until=self.until_entry.get(),
+                                        score=self.score_entry.get(), category=self.category_combobox.get(),
+                                        term=self.term_entry.get())
+        except ValueError as error:
+            self.update_output(str(error), "red")
             return
 
-        data_list, _ = self.get_current_data()
-        item_type = self.tab_view.get()[:-1] if self.tab_view.get().endswith('s') else self.tab_view.get()
-        
-        # Using a while loop to find and modify the item
-        counter = 0
-        while counter < len(data_list):
-            item = data_list[counter]
-            if item == self.currently_selected_item:
-                
-                new_detail = None
-                
-                if item_type in ["Assignment", "Exam"]:
-                    month_str = self.month_entry.get().strip()
-                    day_str = self.day_entry.get().strip()
-                    
-                    if month_str or day_str: # Only attempt validation if the date fields are touched
-                        try:
-                            month = int(month_str)
-                            day = int(day_str)
-                            if not (1 <= month <= 12 and 1 <= day <= 31):
-                                self.update_output("Date validation failed: Month (1-12) or Day (1-31) is invalid.", "red")
-                                return
-                            new_detail = f"Due: {month:02d}/{day:02d}"
-                        except ValueError:
-                            self.update_output("Date input must be valid numbers for Month and Day.", "red")
-                            return
-
-                elif item_type == "Grade":
-                    score_str = self.score_entry.get().strip()
-                    if score_str: # Only attempt validation if the score field is touched
-                        try:
-                            score = float(score_str)
-                            if not (0.0 <= score <= 100.0):
-                                self.update_output("Grade must be a number between 0 and 100.", "red")
-                                return
-                            new_detail = f"{score:.2f}%"
-                        except ValueError:
-                            self.update_output("Grades must be entered as a number (0-100).", "red")
-                            return
-                
-                # Apply modifications
-                if item_name:
-                    item['name'] = item_name
-                if new_detail:
-                    item['details'] = new_detail
-                    
-                self.update_output(f"Modified item: {item['name']}.")
-                break
-            counter += 1
+        if len(modified) == 1:
+            self.update_output(f"Modified item: {modified[0].name}.")
+        else:
+            self.update_output(f"Modified {len(modified)} items.")
 
-        self.currently_selected_item = None
-        self.refresh_lists()
+        self.clear_selection()
+        self.refresh_lists(self.collections[modified[0].kind])
         self.item_entry.delete(0, 'end')
         self.month_entry.delete(0, 'end')
         self.day_entry.delete(0, 'end')
+        self.repeat_entry.delete(0, 'end')
+        self.until_entry.delete(0, 'end')
         self.score_entry.delete(0, 'end')
+        self.term_entry.delete(0, 'end')
+        if not self.category_combobox.get():
+            self.category_combobox.set("General")
 
+    @instrumented("delete_item_wrapper")
     def delete_item_wrapper(self):
-        """A wrapper function to handle deleting a selected item."""
-        if self.currently_selected_item is None:
+        """A wrapper function to handle deleting the selected item(s)."""
+        if not self.selected_items:
             self.update_output("Select an item to delete first.", "red")
             return
         
-        data_list, _ = self.get_current_data()
-        
-        # Using a for loop to delete the item
-        for i in range(len(data_list)):
-            # Check if the list element matches the selected item object
-            if data_list[i] == self.currently_selected_item:
-                data_list.pop(i) # Use pop by index
-                break # Exit the loop after finding and removing the item
+        collection = self.collections[self.currently_selected_item.kind]
+        deleted = len(self.core.delete(list(self.selected_items)))
 
+        self.clear_selection()
+        self.refresh_lists(collection)
+        if deleted == 1:
+            self.update_output("Item deleted successfully. 🗑️")
+        else:
+            self.update_output(f"{deleted} items deleted successfully. 🗑️")
+
+    def undo_wrapper(self):
+        """Undoes the latest change, refreshing only the tabs it touched."""
+        self._apply_history_step(self.core.undo, "Undid", "Nothing to undo.")
+
+    def redo_wrapper(self):
+        """Redoes the latest undone change, refreshing only the tabs it touched."""
+        self._apply_history_step(self.core.redo, "Redid", "Nothing to redo.")
+
+    def _apply_history_step(self, step, verb, empty_message):
+        if self._import_state is not None or not self.items_loaded:
+            self.update_output("Wait for the current import or load to finish.", "red")
+            return
+
+        result = step()
+        if result is None:
+            self.update_output(empty_message, "red")
+            return
+
+        label, kinds = result
+        self.clear_selection() # Selected items may have been removed
+        if kinds:
+            self.refresh_lists(*(self.collections[kind] for kind in kinds))
+        self.update_output(f"{verb}: {label}.")
+
+    def clear_selection(self):
+        """Drops the current selection and its row highlights."""
+        self.selected_items = {}
         self.currently_selected_item = None
-        self.refresh_lists()
-        self.update_output("Item deleted successfully. 🗑️")
+        for list_view in self.list_views.values():
+            if list_view.selected_ids:
+                list_view.set_selection(set())
         
-    def select_item(self, item_data):
-        """Handles selecting an item from a list to prepare for modification/deletion."""
-        self.currently_selected_item = item_data
+    def select_item(self, item_data, additive=False):
+        """
+        Handles selecting an item from a list to prepare for modification/deletion.
+
+        With additive=True (Ctrl/Shift-click) the item is toggled in a multi-item
+        selection of the same kind; the inputs are then left blank so only the
+        fields the user fills in get applied to every selected item.
+        """
+        same_kind = self.currently_selected_item is not None and self.currently_selected_item.kind == item_data.kind
+        if not (additive and same_kind):
+            self.selected_items = {}
+
+        if additive and item_data.id in self.selected_items:
+            del self.selected_items[item_data.id]
+        else:
+            self.selected_items[item_data.id] = item_data
+
+        if not self.selected_items:
+            self.clear_selection()
+            self.update_output("Selection cleared.")
+            return
+
+        # The most recently clicked item that is still selected drives the inputs
+        primary = self.selected_items.get(item_data.id) or next(reversed(self.selected_items.values()))
+        self.currently_selected_item = primary
+        for kind, list_view in self.list_views.items():
+            if kind is primary.kind:
+                list_view.set_selection(set(self.selected_items))
+            elif list_view.selected_ids: # Selection moved to another kind
+                list_view.set_selection(set())
+
         self.item_entry.delete(0, 'end')
-        self.item_entry.insert(0, item_data["name"])
         
         # Clear all input fields for safety
         self.month_entry.delete(0, 'end')
         self.day_entry.delete(0, 'end')
+        self.repeat_entry.delete(0, 'end')
+        self.until_entry.delete(0, 'end')
         self.score_entry.delete(0, 'end')
+        self.term_entry.delete(0, 'end')
 
-        details = item_data["details"]
-        
         # Set the item type for the combobox and show the correct inputs
-        current_tab = self.tab_view.get()
-        item_type = current_tab[:-1] if current_tab.endswith('s') else current_tab
+        item_type = primary.kind.value
         self.item_type_var.set(item_type)
         self.update_input_fields(item_type)
 
-        if item_type in ["Assignment", "Exam"]:
-            # Parse the date "Due: MM/DD"
-            match = re.search(r"(\d{2})/(\d{2})", details)
-            if match:
-                self.month_entry.insert(0, match.group(1))
-                self.day_entry.insert(0, match.group(2))
-        elif item_type == "Grade":
-            # For grades, strip the trailing "%" for cleaner modification input.
-            display_details = details.replace('%', '')
-            self.score_entry.insert(0, display_details)
+        if len(self.selected_items) > 1:
+            # A blank category means "leave each grade's category as it is"
+            self.category_combobox.set("")
+            self.update_output(f"Selected {len(self.selected_items)} items.")
+            return
+
+        self.item_entry.insert(0, primary.name)
+        if primary.due is not None:
+            self.month_entry.insert(0, f"{primary.due.month:02d}")
+            self.day_entry.insert(0, f"{primary.due.day:02d}")
+            if primary.recurrence is not None:
+                self.repeat_entry.insert(0, str(primary.recurrence.interval))
+                if primary.recurrence.until is not None:
+                    # The full date, so a new due date can't shift its year
+                    self.until_entry.insert(0, primary.recurrence.until.isoformat())
+        elif primary.score is not None:
+            self.score_entry.insert(0, f"{primary.score:.2f}")
+            self.category_combobox.set(primary.category)
+            self.term_entry.insert(0, primary.term)
         
-        self.update_output(f"Selected: '{item_data['name']}'")
+        self.update_output(f"Selected: '{primary.name}'")
 
+    @instrumented("_calculate_average")
     def _calculate_average(self):
-        """Calculates the simple average score assuming a 0-100 scale."""
-        total_score = 0.0
-        count = 0
-        
-        # Using a for loop to iterate over the grades list
-        for grade in self.grades:
-            details = grade.get("details", "").replace('%', '') # Remove % for parsing
-            
-            try:
-                # Attempt to parse the stored score (which is now a simple float string)
-                score = float(details)
-                
-                # if statement to ensure the score is in the valid 0-100 range before calculating
-                if 0.0 <= score <= 100.0:
-                    total_score += score
-                    count += 1
-            except ValueError:
-                # Ignore non-numeric/invalid grade strings
-                continue
-
-        if count > 0:
-            percentage = total_score / count
+        """Returns the simple average score (0-100 scale) from the running aggregates."""
+        stats = self.core.grade_stats
+        if stats.count > 0:
             # Show the simple average, and the count of grades considered
-            return f"{percentage:.2f}% (Avg. of {count} scores)"
+            return f"{stats.mean:.2f}% (Avg. of {stats.count} scores)"
         else:
             return "N/A"
 
     def update_grade_summary(self):
-        """Updates the dedicated average label in the Grades tab."""
+        """Updates the dedicated average and statistics labels in the Grades tab."""
         average_str = self._calculate_average()
         self.average_label.configure(text=f"Current Average Grade: {average_str}")
 
-    def refresh_lists(self):
-        """
-        Clears and repopulates all lists in the tab view using for loops,
-        and updates the grade summary.
-        """
-        
-        # Clear existing widgets
-        list_frames = [self.assignment_list_frame, self.exam_list_frame, self.grade_list_frame]
-        for frame in list_frames:
-            for widget in frame.winfo_children():
-                widget.destroy()
+        stats = self.core.grade_stats
+        if stats.count == 0:
+            self.stats_label.configure(text="")
+            return
 
-        # Re-populate assignments list
-        for i, item in enumerate(self.assignments):
-            self.create_item_widget(self.assignment_list_frame, item, i)
+        category_str = ", ".join(f"{category} {average:.1f}%"
+                                 for category, average in sorted(stats.category_averages().items()))
+        self.stats_label.configure(text=(
+            f"Weighted: {stats.weighted_average():.2f}%  |  Median: {stats.median:.2f}%  |  "
+            f"P25/P75: {stats.percentile(25):.2f}/{stats.percentile(75):.2f}%\n"
+            f"Min/Max: {stats.minimum:.2f}/{stats.maximum:.2f}%  |  Std. dev: {stats.std_dev:.2f}\n"
+            f"By category: {category_str}\n"
+            f"{self._analytics_summary()}"))
 
-        # Re-populate exams list
-        for i, item in enumerate(self.exams):
-            self.create_item_widget(self.exam_list_frame, item, i)
+    def _analytics_summary(self):
+        """GPA by term, letter distribution and trend lines for the Grades tab."""
+        analytics = self.analytics
+        terms = analytics.term_summaries()
+        term_str = " · ".join(f"{row['term'] or 'No term'} {row['gpa']:.2f} ({row['count']})" for row in terms[-4:])
+        letter_str = " · ".join(f"{letter} {count}" for letter, count in analytics.letter_histogram().items())
+        lines = [f"GPA: {analytics.cumulative_gpa():.2f} overall  |  {term_str}", f"Letters: {letter_str}"]
 
-        # Re-populate grades list
-        for i, item in enumerate(self.grades):
-            self.create_item_widget(self.grade_list_frame, item, i)
+        moving_average, slope = analytics.trend()
+        if slope is not None:
+            lines[-1] += f"  |  Trend: {slope:+.2f} pts/grade (recent avg. {moving_average[-1]:.1f}%)"
+        return "\n".join(lines)
+
+    def solve_needed_score(self):
+        """Reports the score the next grade in the chosen category needs to reach the target average."""
+        try:
+            target = float(self.target_entry.get())
+        except ValueError:
+            self.update_output("Target must be a number between 0 and 100.", "red")
+            return
+        if not (0 <= target <= 100):
+            self.update_output("Target must be a number between 0 and 100.", "red")
+            return
+
+        category = self.final_category_combobox.get().strip() or "Exam"
+        needed = self.analytics.needed_score(target, category)
+        if needed is None:
+            self.update_output(f"{category} grades carry no weight.", "red")
+        elif needed > 100:
+            self.update_output(f"{target:.1f}% is out of reach (needs {needed:.1f}% on the {category}).", "red")
+        elif needed <= 0:
+            self.update_output(f"{target:.1f}% is already secured. 🎉")
+        else:
+            self.update_output(f"You need {needed:.1f}% on the {category} for {target:.1f}%.")
+
+    @instrumented("refresh_lists")
+    def refresh_lists(self, *changed_lists):
+        """
+        Brings the tab lists in sync with the data and updates the grade summary.
+
+        Only the lists passed in are refreshed (all three when called without
+        arguments). Each list view re-texts just the visible rows that changed.
+        """
+        for kind, list_view in self.list_views.items():
+            data_list = self.collections[kind]
+            if changed_lists and not any(data_list is changed for changed in changed_lists):
+                continue # Untouched tab, leave its widgets alone
+            list_view.set_items(self.visible_items(data_list))
+
+        # The calendar shows assignments and exams
+        if self.calendar_view is not None and (not changed_lists or any(
+                changed is self.assignments or changed is self.exams for changed in changed_lists)):
+            self.calendar_view.render()
 
         # IMPORTANT: Update the grade average whenever the grades list changes
-        self.update_grade_summary()
+        # (tabs that haven't been built yet are filled when first shown)
+        grades_shown = ItemKind.GRADE in self.list_views
+        if grades_shown and (not changed_lists or any(changed is self.grades for changed in changed_lists)):
+            self.update_grade_summary()
 
-    def create_item_widget(self, parent_frame, item_data, index):
-        """Creates a single item widget (button) for a list."""
-        item_text = f"{index + 1}. {item_data['name']} - {item_data['details']}"
-        
-        # A simple check (if statement) to color-code items
-        fg_color = "gray30"
-        
-        if parent_frame == self.grade_list_frame:
-            # Grades are green
-            fg_color = "darkgreen"
-        elif parent_frame == self.exam_list_frame:
-             # Exams are red
-             fg_color = "darkred"
-
-            
-        item_button = ctk.CTkButton(parent_frame, text=item_text,
-                                    command=lambda data=item_data: self.select_item(data),
-                                    fg_color=fg_color, anchor="w",
-                                    hover_color=("gray60" if ctk.get_appearance_mode() == "Light" else "gray20"))
-        item_button.grid(row=index, column=0, padx=5, pady=(5, 5), sticky="ew")
+    def _item_text(self, item_data, index):
+        """Formats the display text of a list row."""
+        return f"{index + 1}. {item_data.name} - {item_data.details}"
 
+    @instrumented("create_item_widget")
+    def create_item_widget(self, list_view, command):
+        """Creates a single (recyclable) row widget for a list view."""
+        # Color-coded by kind (grades green, exams red) from the shared style registry
+        style = ROW_STYLES.get(list_view.kind, ROW_STYLES[ItemKind.ASSIGNMENT])
+        item_button = ctk.CTkButton(list_view.viewport, text="", height=28,
+                                    command=command, border_width=0,
+                                    border_color=ROW_BORDER_COLOR, anchor="w", **style)
+        return item_button
+
+    @instrumented("theme switch")
     def change_appearance_mode_event(self):
         """Toggles the application's global appearance mode (Light/Dark)."""
         # The switch toggles between 1 (on/dark) and 0 (off/light)
@@ -475,19 +1296,133 @@ class StudentOrganizerApp(ctk.CTk):
         else:
             ctk.set_appearance_mode("Light")
 
+    def toggle_perf_overlay(self, from_key=False):
+        """Shows or hides the performance overlay, keeping the sidebar switch in step."""
+        self.perf_overlay.toggle()
+        if from_key:
+            if self.perf_overlay.shown:
+                self.perf_switch.select()
+            else:
+                self.perf_switch.deselect()
+
+    def import_items_wrapper(self):
+        """Asks for a CSV/JSON Lines file and imports it on a worker thread."""
+        path = filedialog.askopenfilename(title="Import items",
+                                          filetypes=[("CSV or JSON Lines", "*.csv *.jsonl *.ndjson"),
+                                                     ("All files", "*.*")])
+        if not path:
+            return
+
+        # The Import button doubles as Cancel while the import runs
+        self.import_button.configure(text="✖ Cancel", command=self.cancel_import)
+        self.import_progress.set(0)
+        self.import_progress.grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky="ew")
+        self._import_state = {"imported": 0, "error_count": 0, "errors": [], "changed": set(),
+                              # Bounds how many parsed chunks can wait for the Tk thread
+                              "slots": threading.Semaphore(2)}
+        self._import_state["task"] = self.scheduler.submit(
+            self._read_import_file, path, self._import_state["slots"], key="import", with_task=True,
+            on_done=lambda _: self._finish_import(), on_error=self._import_failed)
+
+    def _read_import_file(self, task, path, slots):
+        """Worker side of an import: parses the file and posts each chunk to the Tk thread."""
+        for items, errors, fraction_done in iter_item_chunks(path):
+            while not slots.acquire(timeout=0.1):
+                if task.cancelled:
+                    return
+            if task.cancelled:
+                return
+            task.post(self._add_import_chunk, items, errors, fraction_done)
+
+    def _add_import_chunk(self, items, errors, fraction_done):
+        """Adds one parsed chunk of imported items (runs on the Tk thread)."""
+        state = self._import_state
+        state["slots"].release()
+
+        state["changed"].update(self.core.add_items(items, label=f"import {state['imported'] + len(items)} items",
+                                                    group=state["task"]))
+
+        state["imported"] += len(items)
+        state["error_count"] += len(errors)
+        state["errors"].extend(errors[:100 - len(state["errors"])]) # Keep only the first 100 messages
+
+        self.import_progress.set(fraction_done)
+        self.update_output(f"Importing... {fraction_done:.0%} ({state['imported']} items)")
+
+    def cancel_import(self):
+        """Stops a running import, keeping the items added so far."""
+        if self._import_state is not None:
+            self._import_state["task"].cancel()
+            self._finish_import(cancelled=True)
+
+    def _import_failed(self, error):
+        state = self._import_state
+        state["errors"].insert(0, (0, f"Import stopped: {error}"))
+        state["error_count"] += 1
+        self._finish_import()
+
+    def _finish_import(self, cancelled=False):
+        """Refreshes the lists touched by the import (once) and reports the outcome."""
+        state = self._import_state
+        self._import_state = None
+        self.import_progress.grid_forget()
+        self.import_button.configure(text="📥 Import...", command=self.import_items_wrapper)
+
+        if state["changed"]:
+            self.refresh_lists(*(self.collections[kind] for kind in state["changed"]))
+
+        if cancelled:
+            self.update_output(f"Import cancelled after {state['imported']} items.", "red")
+        elif state["error_count"]:
+            first_line, first_message = state["errors"][0]
+            self.update_output(f"Imported {state['imported']} items, {state['error_count']} bad rows "
+                               f"(line {first_line}: {first_message})", "red")
+            print(f"Import: {state['error_count']} bad rows", file=sys.stderr)
+            for line_number, message in state["errors"]:
+                print(f"  line {line_number}: {message}", file=sys.stderr)
+        else:
+            self.update_output(f"Imported {state['imported']} items. 📥")
+
+    def export_items_wrapper(self):
+        """Asks for a destination file and streams every item to it on a worker thread."""
+        path = filedialog.asksaveasfilename(title="Export items", defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl")])
+        if not path:
+            return
+
+        # Snapshot the items so the worker never iterates a collection being edited
+        all_items = self.core.all_items()
+        self.export_button.configure(state="disabled") # One export at a time
+        self.update_output("Exporting...")
+        self.scheduler.submit(export_items, path, all_items,
+                              on_done=lambda count: self._finish_export(f"Exported {count} items. 📤"),
+                              on_error=lambda error: self._finish_export(f"Export failed: {error}", "red"))
+
+    def _finish_export(self, message, color="gray"):
+        self.export_button.configure(state="normal")
+        self.update_output(message, color)
+
     def add_dummy_data(self):
-        """Populates the lists with some initial data for demonstration."""
-        # Dates changed to the new MM/DD format
-        self.assignments.append({"name": "Math Homework 3", "details": "Due: 11/15"})
-        self.assignments.append({"name": "History Essay Outline", "details": "Due: 11/20"})
-        self.exams.append({"name": "Physics Midterm", "details": "Due: 11/25"})
-        self.exams.append({"name": "Chemistry Final Exam", "details": "Due: 12/10"})
-        # Dummy grades updated to the 0-100 float format
-        self.grades.append({"name": "Quiz 1 Grade", "details": "95.00%"}) 
-        self.grades.append({"name": "Lab Report Score", "details": "88.50%"}) 
-        self.grades.append({"name": "Major Project Score", "details": "75.00%"}) 
+        """Populates (and stores) some initial data for demonstration."""
+        term = current_term()
+        dummy_items = [
+            Item(ItemKind.ASSIGNMENT, "Math Homework 3", due=make_due_date(11, 15)),
+            Item(ItemKind.ASSIGNMENT, "History Essay Outline", due=make_due_date(11, 20)),
+            Item(ItemKind.EXAM, "Physics Midterm", due=make_due_date(11, 25)),
+            Item(ItemKind.EXAM, "Chemistry Final Exam", due=make_due_date(12, 10)),
+            Item(ItemKind.GRADE, "Quiz 1 Grade", score=95.0, category="Quiz", term=term),
+            Item(ItemKind.GRADE, "Lab Report Score", score=88.5, category="Lab", term=term),
+            Item(ItemKind.GRADE, "Major Project Score", score=75.0, category="Project", term=term),
+        ]
+        self.core.add_items(dummy_items, record=False)
         self.refresh_lists()
 
+    def on_close(self):
+        """Stops background work and flushes pending writes, then closes the window."""
+        self.scheduler.shutdown()
+        self.profiles.close()
+        self.destroy()
+
 # --- 7. Main Execution Block ---
 if __name__ == "__main__":
     app = StudentOrganizerApp()
@@ -0,0 +1,273 @@
+"""
+Grade analytics for the Student Organization Tool.
+
+GradeAnalytics turns the grades collection into columns (scores, category and
+term codes) and answers weighted averages, per-term GPA, letter-grade
+histograms, "what do I need on the final" and the trend over time with array
+operations: NumPy when it is installed, the standard array module (and plain
+loops) otherwise. Columns and results are cached until the collection's
+version changes, i.e. only a grade change triggers a recomputation.
+"""
+from array import array
+from bisect import bisect_right
+
+from scholex_core import CATEGORY_WEIGHTS, term_sort_key
+
+try:
+    import numpy as np
+except ImportError: # Optional: fall back to the array module
+    np = None
+
+# Letter grades from lowest to highest: lower score bound and grade points
+LETTER_GRADES = (("F", 0, 0.0), ("D", 60, 1.0), ("C", 70, 2.0), ("B", 80, 3.0), ("A", 90, 4.0))
+LETTER_CUTOFFS = tuple(bound for _, bound, _ in LETTER_GRADES[1:])
+GRADE_POINTS = tuple(points for _, _, points in LETTER_GRADES)
+
+
+# --- Array Primitives (NumPy, or array module fallback) ---
+if np is not None:
+    def _column(values, typecode):
+        return np.fromiter(values, dtype=np.float64 if typecode == "d" else np.intp)
+
+    def _bincount(codes, weights, size):
+        if weights is None:
+            return np.bincount(codes, minlength=size).astype(np.float64)
+        return np.bincount(codes, weights=weights, minlength=size)
+
+    def _letter_indexes(scores):
+        return np.searchsorted(np.asarray(LETTER_CUTOFFS, dtype=np.float64), scores, side="right")
+
+    def _take(table, indexes):
+        return np.asarray(table, dtype=np.float64)[indexes]
+
+    def _combine(major, minor, minor_size):
+        return major * minor_size + minor
+
+    def _select(values, codes, code):
+        return values[codes == code]
+
+    def _moving_average(values, window):
+        sums = np.concatenate(([0.0], np.cumsum(values)))
+        return ((sums[window:] - sums[:-window]) / window).tolist()
+
+    def _slope(values):
+        x = np.arange(len(values), dtype=np.float64)
+        x -= x.mean()
+        return float(np.dot(x, values - values.mean()) / np.dot(x, x))
+else:
+    def _column(values, typecode):
+        return array(typecode, values)
+
+    def _bincount(codes, weights, size):
+        counts = [0.0] * size
+        if weights is None:
+            for code in codes:
+                counts[code] += 1
+        else:
+            for code, weight in zip(codes, weights):
+                counts[code] += weight
+        return counts
+
+    def _letter_indexes(scores):
+        return array("l", (bisect_right(LETTER_CUTOFFS, score) for score in scores))
+
+    def _take(table, indexes):
+        return array("d", (table[index] for index in indexes))
+
+    def _combine(major, minor, minor_size):
+        return array("l", (a * minor_size + b for a, b in zip(major, minor)))
+
+    def _select(values, codes, code):
+        return array(values.typecode, (value for value, value_code in zip(values, codes) if value_code == code))
+
+    def _moving_average(values, window):
+        averages = []
+        running = sum(values[:window])
+        averages.append(running / window)
+        for index in range(window, len(values)):
+            running += values[index] - values[index - window]
+            averages.append(running / window)
+        return averages
+
+    def _slope(values):
+        count = len(values)
+        x_mean = (count - 1) / 2
+        y_mean = sum(values) / count
+        numerator = sum((index - x_mean) * (value - y_mean) for index, value in enumerate(values))
+        denominator = sum((index - x_mean) ** 2 for index in range(count))
+        return numerator / denominator
+
+
+# --- Analytics Engine ---
+class GradeAnalytics:
+    """
+    Cached, array-based analytics over one grades ItemCollection.
+
+    Every public result is memoised per argument set; the cache (and the columns
+    it was computed from) is dropped as soon as collection.version moves.
+    """
+
+    def __init__(self, collection, weights=CATEGORY_WEIGHTS):
+        self.collection = collection
+        self.weights = weights
+        self._version = None
+        self._cache = {}
+
+    # --- Columns ---
+    def _columns(self):
+        """(scores, category codes, term codes, categories, terms) for the current grades."""
+        if self._version != self.collection.version:
+            self._cache = {}
+            self._version = self.collection.version
+        columns = self._cache.get("columns")
+        if columns is None:
+            items = self.collection.ordered() # Entry (ID) order doubles as time order
+            item_categories = [item.category for item in items]
+            item_terms = [item.term for item in items]
+            categories = sorted(set(item_categories))
+            terms = sorted(set(item_terms), key=term_sort_key)
+            category_codes = {category: code for code, category in enumerate(categories)}
+            term_codes = {term: code for code, term in enumerate(terms)}
+            columns = self._cache["columns"] = (
+                _column([item.score for item in items], "d"),
+                _column(map(category_codes.__getitem__, item_categories), "l"),
+                _column(map(term_codes.__getitem__, item_terms), "l"),
+                categories, terms)
+        return columns
+
+    def _cached(self, key, compute):
+        self._columns() # Drops stale results first
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _category_weight(self, category):
+        return self.weights.get(category, self.weights.get("General", 1))
+
+    def _weighted_mean(self, sums, counts, categories):
+        """Average of the category means (sums / counts), weighted by category weight."""
+        weighted_sum = 0.0
+        weight_total = 0.0
+        for code, category in enumerate(categories):
+            if counts[code]:
+                weight = self._category_weight(category)
+                weighted_sum += weight * sums[code] / counts[code]
+                weight_total += weight
+        return float(weighted_sum / weight_total) if weight_total else None
+
+    def _term_category_totals(self, values):
+        """Per-term rows of per-category (sums, counts) of values, in one bincount pass each."""
+        _, category_codes, term_codes, categories, terms = self._columns()
+        size = len(terms) * len(categories)
+        cells = _combine(term_codes, category_codes, len(categories))
+        sums = _bincount(cells, values, size)
+        counts = _bincount(cells, None, size)
+        width = len(categories)
+        return [(sums[row * width:(row + 1) * width], counts[row * width:(row + 1) * width])
+                for row in range(len(terms))]
+
+    def _grade_points(self):
+        return self._cached("points", lambda: _take(GRADE_POINTS, _letter_indexes(self._columns()[0])))
+
+    # --- Results ---
+    def weighted_average(self, term=None):
+        """Category-weighted average score of every grade (or one term's); None without grades."""
+        def compute():
+            scores, category_codes, _, categories, terms = self._columns()
+            if term is None:
+                sums = _bincount(category_codes, scores, len(categories))
+                counts = _bincount(category_codes, None, len(categories))
+                return self._weighted_mean(sums, counts, categories)
+            summary = next((row for row in self.term_summaries() if row["term"] == term), None)
+            return summary["average"] if summary else None
+        return self._cached(("weighted_average", term), compute)
+
+    def term_summaries(self):
+        """
+        Per-term results in chronological order: dicts with term, count, the
+        weighted average score and the GPA (4.0 scale, same weighting applied to
+        each grade's points).
+        """
+        def compute():
+            _, _, _, categories, terms = self._columns()
+            score_rows = self._term_category_totals(self._columns()[0])
+            point_rows = self._term_category_totals(self._grade_points())
+            summaries = []
+            for term, (score_sums, counts), (point_sums, _) in zip(terms, score_rows, point_rows):
+                summaries.append({"term": term, "count": int(sum(counts)),
+                                  "average": self._weighted_mean(score_sums, counts, categories),
+                                  "gpa": self._weighted_mean(point_sums, counts, categories)})
+            return summaries
+        return self._cached("term_summaries", compute)
+
+    def cumulative_gpa(self):
+        """GPA over every grade (category-weighted grade points), or None."""
+        def compute():
+            _, category_codes, _, categories, _ = self._columns()
+            sums = _bincount(category_codes, self._grade_points(), len(categories))
+            counts = _bincount(category_codes, None, len(categories))
+            return self._weighted_mean(sums, counts, categories)
+        return self._cached("cumulative_gpa", compute)
+
+    def letter_histogram(self, term=None):
+        """{letter: count} from A to F, over every grade or one term."""
+        def compute():
+            scores, _, term_codes, _, terms = self._columns()
+            letters = _letter_indexes(scores)
+            if term is not None:
+                if term not in terms:
+                    return {letter: 0 for letter, _, _ in reversed(LETTER_GRADES)}
+                letters = _select(letters, term_codes, terms.index(term))
+            counts = _bincount(letters, None, len(LETTER_GRADES))
+            return {letter: int(counts[index]) for index, (letter, _, _) in reversed(list(enumerate(LETTER_GRADES)))}
+        return self._cached(("letter_histogram", term), compute)
+
+    def trend(self, window=10):
+        """
+        (moving averages, slope) of the scores in entry order.
+
+        The moving average covers window consecutive grades; the slope is the
+        least-squares change in score per grade entered. Both are empty/None
+        with fewer than two grades.
+        """
+        def compute():
+            scores = self._columns()[0]
+            if len(scores) < 2:
+                return [], None
+            return _moving_average(scores, min(window, len(scores))), _slope(scores)
+        return self._cached(("trend", window), compute)
+
+    def needed_score(self, target, category="Exam", term=None):
+        """
+        The score the next grade in category needs for the weighted average (of
+        every grade, or of one term) to reach target.
+
+        Solves the weighted-average equation for the new grade; the result may be
+        above 100 (target out of reach) or below 0 (already secured). None if the
+        category carries no weight.
+        """
+        def compute():
+            _, category_codes, term_codes, categories, terms = self._columns()
+            weight = self._category_weight(category)
+            if weight <= 0:
+                return None
+
+            if term is None:
+                scores = self._columns()[0]
+                category_sums = _bincount(category_codes, scores, len(categories))
+                category_counts = _bincount(category_codes, None, len(categories))
+            elif term in terms:
+                category_sums, category_counts = self._term_category_totals(self._columns()[0])[terms.index(term)]
+            else:
+                category_sums, category_counts = [0.0] * len(categories), [0.0] * len(categories)
+            sums, counts = {}, {}
+            for name, total, count in zip(categories, category_sums, category_counts):
+                if count:
+                    sums[name], counts[name] = float(total), float(count)
+
+            # target = (others + weight * (sum + x) / (count + 1)) / (other_weight + weight)
+            others = sum(self._category_weight(name) * sums[name] / counts[name] for name in sums if name != category)
+            other_weight = sum(self._category_weight(name) for name in sums if name != category)
+            needed_mean = (target * (other_weight + weight) - others) / weight
+            return needed_mean * (counts.get(category, 0) + 1) - sums.get(category, 0.0)
+        return self._cached(("needed_score", target, category, term), compute)
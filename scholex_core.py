@@ -0,0 +1,1549 @@
+"""
+Headless core of the Student Organization Tool.
+
+Everything here is plain Python (no Tk): the item model, the per-kind
+collections and their indexes, grade statistics, validation, SQLite storage,
+bulk import/export and the OrganizerCore facade the GUI calls into. It can be
+driven, tested and benchmarked without a display.
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, deque
+import csv
+import heapq
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from enum import Enum
+import itertools
+import json
+import os
+from pathlib import Path
+import queue
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import quote, unquote
+
+# Source of stable item IDs (unique for the lifetime of the process)
+_item_ids = itertools.count(1)
+_item_ids_lock = threading.Lock() # Profiles load (and reserve IDs) on worker threads
+
+
+def _next_item_id():
+    with _item_ids_lock:
+        return next(_item_ids)
+
+
+# Where items are persisted between runs: the default profile keeps the
+# original database, every other profile gets its own file in PROFILES_DIR
+DB_PATH = Path.home() / ".scholex" / "scholex.db"
+PROFILES_DIR = DB_PATH.parent / "profiles"
+DEFAULT_PROFILE = "Student"
+
+# Relative weight of each grade category in the weighted average.
+# Categories not listed here count with the "General" weight.
+CATEGORY_WEIGHTS = {"Exam": 40, "Project": 25, "Quiz": 15, "Homework": 10, "Lab": 10, "General": 10}
+
+# Marks an Item.update() argument that was not given (None is a valid recurrence)
+_UNSET = object()
+
+# --- Item Model ---
+class ItemKind(Enum):
+    """The three categories of items, valued by their display name."""
+    ASSIGNMENT = "Assignment"
+    EXAM = "Exam"
+    GRADE = "Grade"
+
+
+@dataclass(frozen=True, slots=True)
+class Recurrence:
+    """
+    A repeat rule: every interval days from the item's due date, optionally
+    until a date (inclusive). Stored once; dates are generated on demand.
+    """
+    interval: int = 7
+    until: date | None = None
+
+    def occurrences(self, first, start, end):
+        """Lazily yields the dates of the series starting on first that fall in [start, end)."""
+        if self.until is not None:
+            end = min(end, self.until + timedelta(days=1))
+        step = timedelta(days=self.interval)
+        skipped = max(0, -(-(start - first).days // self.interval)) # Jump straight to the window
+        day = first + step * skipped
+        while day < end:
+            yield day
+            day += step
+
+    def next_on_or_after(self, first, day):
+        """The first date of the series starting on first that is on or after day; else its last date."""
+        upcoming = next(self.occurrences(first, day, date.max), None)
+        if upcoming is not None:
+            return upcoming
+        # The series has ended (only possible with an until date); an until before
+        # first leaves just the first date
+        return first + timedelta(days=self.interval * max(0, (self.until - first).days // self.interval))
+
+    def describe(self):
+        text = {1: "daily", 7: "weekly"}.get(self.interval, f"every {self.interval} days")
+        if self.until is not None:
+            text += f" until {self.until.month:02d}/{self.until.day:02d}"
+        return text
+
+    def to_text(self):
+        """Storage form: "7" or "7:2026-12-18"."""
+        return f"{self.interval}:{self.until.isoformat()}" if self.until else str(self.interval)
+
+    @classmethod
+    def from_text(cls, text):
+        interval, _, until = text.partition(":")
+        return cls(int(interval), date.fromisoformat(until) if until else None)
+
+
+@dataclass(slots=True, eq=False)
+class Item:
+    """
+    A single assignment, exam or grade.
+
+    Holds parsed values (a real due date, a numeric score) instead of display
+    strings; the "Due: MM/DD" / "95.00%" text is formatted on first use and
+    cached until update() changes the item (or, for a repeating item, until the
+    day changes, since it shows the next occurrence). Compared by identity.
+    """
+    kind: ItemKind
+    name: str
+    due: date | None = None
+    score: float | None = None
+    category: str = "General"
+    term: str = ""
+    recurrence: Recurrence | None = None
+    id: int = field(default_factory=_next_item_id)
+    _details: str | None = field(default=None, repr=False)
+    _details_day: date | None = field(default=None, repr=False) # Day a repeating item's text was made
+
+    def next_due(self, today=None):
+        """The due date that matters today: a repeating item's next occurrence (or its last, once ended)."""
+        if self.recurrence is None or self.due is None:
+            return self.due
+        return self.recurrence.next_on_or_after(self.due, today or date.today())
+
+    @property
+    def details(self):
+        """Display text for the item's date or score, formatted lazily."""
+        if self.recurrence is not None and self._details_day != date.today():
+            self._details = None
+        if self._details is None:
+            if self.score is not None:
+                self._details = f"{self.score:.2f}% ({self.category}{', ' + self.term if self.term else ''})"
+            elif self.due is not None:
+                due = self.next_due()
+                self._details = f"Due: {due.month:02d}/{due.day:02d}"
+                if self.recurrence is not None:
+                    self._details_day = date.today()
+                    self._details += f", {self.recurrence.describe()}"
+            else:
+                self._details = ""
+        return self._details
+
+    def update(self, name=None, due=None, score=None, category=None, term=None, recurrence=_UNSET):
+        """Applies the given (non-None) changes and drops the cached display text.
+
+        recurrence is applied whenever it is passed, so None stops a repeat.
+        """
+        if name is not None:
+            self.name = name
+        if due is not None:
+            self.due = due
+        if score is not None:
+            self.score = score
+        if category is not None:
+            self.category = category
+        if term is not None:
+            self.term = term
+        if recurrence is not _UNSET:
+            self.recurrence = recurrence
+        self._details = None
+
+
+class SortedKeyList:
+    """
+    A sorted list of unique keys kept in bounded buckets.
+
+    add() and remove() bisect over the bucket maxima and then inside a single
+    bucket of at most 2 * LOAD keys, so they cost O(log n) plus a small bounded
+    shift and the list is never re-sorted. Positional access (used by the list
+    views) goes through a prefix sum of bucket sizes rebuilt after changes.
+    """
+
+    LOAD = 500
+
+    def __init__(self):
+        self._buckets = []
+        self._maxes = []     # Largest key of each bucket
+        self._offsets = None # Position of each bucket's first key, rebuilt lazily
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._buckets)
+
+    def add(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+        else:
+            pos = bisect_left(self._maxes, key)
+            if pos == len(self._maxes):
+                # Larger than every key: append to the last bucket
+                pos -= 1
+                self._buckets[pos].append(key)
+                self._maxes[pos] = key
+            else:
+                insort(self._buckets[pos], key)
+
+            bucket = self._buckets[pos]
+            if len(bucket) > 2 * self.LOAD:
+                upper = bucket[self.LOAD:]
+                del bucket[self.LOAD:]
+                self._buckets.insert(pos + 1, upper)
+                self._maxes[pos] = bucket[-1]
+                self._maxes.insert(pos + 1, upper[-1])
+
+        self._len += 1
+        self._offsets = None
+
+    def remove(self, key):
+        pos = bisect_left(self._maxes, key)
+        bucket = self._buckets[pos] if pos < len(self._buckets) else []
+        index = bisect_left(bucket, key)
+        if index == len(bucket) or bucket[index] != key:
+            raise ValueError(f"{key!r} is not in the list")
+
+        del bucket[index]
+        if bucket:
+            self._maxes[pos] = bucket[-1]
+        else:
+            del self._buckets[pos]
+            del self._maxes[pos]
+        self._len -= 1
+        self._offsets = None
+
+    def _bucket_offsets(self):
+        if self._offsets is None:
+            self._offsets = list(itertools.accumulate((len(bucket) for bucket in self._buckets), initial=0))
+        return self._offsets
+
+    def __getitem__(self, index):
+        if not 0 <= index < self._len:
+            raise IndexError("SortedKeyList index out of range")
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return self._buckets[pos][index - offsets[pos]]
+
+    def iter_from(self, index):
+        """Iterates the keys from position index onwards."""
+        if index >= self._len:
+            return iter(())
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return itertools.chain(itertools.islice(self._buckets[pos], index - offsets[pos], None),
+                               itertools.chain.from_iterable(self._buckets[pos + 1:]))
+
+    def bisect_left(self, key):
+        """Position of the first key >= key."""
+        pos = bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._bucket_offsets()[pos] + bisect_left(self._buckets[pos], key)
+
+
+class ItemRangeView:
+    """Read-only sequence of the items at positions start..stop of a (due, id) key list."""
+
+    def __init__(self, keys, by_id, start, stop):
+        self.keys = keys
+        self.by_id = by_id
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("ItemRangeView index out of range")
+        return self.by_id[self.keys[self.start + index][1]]
+
+
+class MergedItemView:
+    """
+    Read-only sequence of an ItemRangeView with a few extra items spliced in.
+
+    extra must be sorted by the (due, id) keys given in extra_keys; each one's
+    position is found with one bisect of the view's key list, so indexing costs
+    O(log len(extra)) and the view itself is never copied.
+    """
+
+    def __init__(self, view, extra, extra_keys):
+        self.view = view
+        self.extra = extra
+        self.positions = [offset + min(max(view.keys.bisect_left(key) - view.start, 0), len(view))
+                          for offset, key in enumerate(extra_keys)]
+
+    def __len__(self):
+        return len(self.view) + len(self.extra)
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("MergedItemView index out of range")
+        before = bisect_left(self.positions, index) # Extra items ahead of this position
+        if before < len(self.positions) and self.positions[before] == index:
+            return self.extra[before]
+        return self.view[index - before]
+
+
+class SearchIndex:
+    """
+    Inverted index from lowercase word tokens to item IDs.
+
+    Updated per add/remove rather than rebuilt. The distinct tokens are also kept
+    in a SortedKeyList, so every token starting with a typed prefix is a
+    contiguous range found with one bisect.
+    """
+
+    def __init__(self):
+        self.postings = {}              # token -> set of item IDs
+        self.tokens = SortedKeyList()
+
+    @staticmethod
+    def tokenize(text):
+        return set(re.findall(r"\w+", text.lower()))
+
+    @staticmethod
+    def _item_tokens(item):
+        text = f"{item.name} {item.category} {item.term}" if item.kind is ItemKind.GRADE else item.name
+        return SearchIndex.tokenize(text)
+
+    def add(self, item):
+        for token in self._item_tokens(item):
+            ids = self.postings.get(token)
+            if ids is None:
+                ids = self.postings[token] = set()
+                self.tokens.add(token)
+            ids.add(item.id)
+
+    def remove(self, item):
+        for token in self._item_tokens(item):
+            ids = self.postings.get(token)
+            if ids is None:
+                continue
+            ids.discard(item.id)
+            if not ids:
+                del self.postings[token]
+                self.tokens.remove(token)
+
+    def _prefix_ids(self, prefix):
+        """IDs of the items having a token that starts with prefix."""
+        exact = self.postings.get(prefix)
+        matches = set(exact) if exact else set()
+        for token in self.tokens.iter_from(self.tokens.bisect_left(prefix)):
+            if not token.startswith(prefix):
+                break
+            if token != prefix:
+                matches.update(self.postings[token])
+        return matches
+
+    def search(self, query):
+        """IDs of the items matching every word of query (each word as a prefix)."""
+        result = None
+        # Longest words first: they tend to be the most selective
+        for term in sorted(self.tokenize(query), key=len, reverse=True):
+            ids = self._prefix_ids(term)
+            result = ids if result is None else result & ids
+            if not result:
+                return set()
+        return result if result is not None else set()
+
+
+class ItemCollection:
+    """
+    The items of one kind, indexed by their stable ID.
+
+    Lookup, add and removal are O(1) dict operations; the ID-ordered list the
+    list views display is only materialized when asked for after a change. IDs
+    grow with insertion, so by_id is kept in ID order and only needs re-sorting
+    after an older item comes back (an undone delete).
+    Dated kinds also keep a due-date index of (due, id) keys of the one-off
+    items for sorted and date-range views; recurring items are listed in
+    recurring instead, since their date moves with each occurrence. version increases with every change, so derived
+    results (e.g. the grade analytics) can be cached until the collection changes.
+    """
+
+    def __init__(self, kind):
+        self.kind = kind
+        self.version = 0
+        self.by_id = {}
+        self.recurring = {} # id -> item, for the items with a recurrence rule
+        self._ordered = []
+        self._resort = False # An item was re-added behind newer ones
+        self.due_index = SortedKeyList() if kind is not ItemKind.GRADE else None
+        self.search_index = SearchIndex()
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __iter__(self):
+        self._restore_order()
+        return iter(self.by_id.values())
+
+    def __contains__(self, item_id):
+        return item_id in self.by_id
+
+    def get(self, item_id):
+        return self.by_id.get(item_id)
+
+    def _indexed(self, item):
+        return self.due_index is not None and item.due is not None and item.recurrence is None
+
+    def add(self, item):
+        if self.by_id and item.id < next(reversed(self.by_id)):
+            self._resort = True
+        self.by_id[item.id] = item
+        self.version += 1
+        self._ordered = None
+        self.search_index.add(item)
+        if self._indexed(item):
+            self.due_index.add((item.due, item.id))
+        if item.recurrence is not None:
+            self.recurring[item.id] = item
+
+    def remove(self, item_id):
+        """Removes and returns the item with the given ID (None if absent)."""
+        item = self.by_id.pop(item_id, None)
+        if item is not None:
+            self.version += 1
+            self._ordered = None
+            self.search_index.remove(item)
+            if self._indexed(item):
+                self.due_index.remove((item.due, item.id))
+            self.recurring.pop(item_id, None)
+        return item
+
+    def update_item(self, item, **changes):
+        """Applies Item.update(**changes), keeping the due-date and search indexes in step."""
+        old_key = (item.due, item.id) if self._indexed(item) else None
+        retokenize = any(changes.get(key) not in (None, getattr(item, key)) for key in ("name", "category", "term"))
+        if retokenize:
+            self.search_index.remove(item)
+        item.update(**changes)
+        self.version += 1
+        if item.recurrence is not None:
+            self.recurring[item.id] = item
+        else:
+            self.recurring.pop(item.id, None)
+        new_key = (item.due, item.id) if self._indexed(item) else None
+        if old_key != new_key: # Moved, or started/stopped repeating
+            if old_key is not None:
+                self.due_index.remove(old_key)
+            if new_key is not None:
+                self.due_index.add(new_key)
+        if retokenize:
+            self.search_index.add(item)
+
+    def search(self, query):
+        """Items matching the query, in insertion (ID) order."""
+        by_id = self.by_id
+        return [by_id[item_id] for item_id in sorted(self.search_index.search(query))]
+
+    def _restore_order(self):
+        """Puts by_id back in ID order (in place, so views holding it stay valid)."""
+        if self._resort:
+            items = sorted(self.by_id.items())
+            self.by_id.clear()
+            self.by_id.update(items)
+            self._resort = False
+
+    def ordered(self):
+        """ID-ordered (i.e. entry-ordered) list of the items, cached until the next add/remove."""
+        if self._ordered is None:
+            self._restore_order()
+            self._ordered = list(self.by_id.values())
+        return self._ordered
+
+    def by_due(self, start=None, end=None):
+        """One-off items due in [start, end) sorted by due date, as a lazy view (O(log n) to build)."""
+        keys = self.due_index
+        lo = keys.bisect_left((start, 0)) if start is not None else 0
+        hi = keys.bisect_left((end, 0)) if end is not None else len(keys)
+        return ItemRangeView(keys, self.by_id, lo, max(lo, hi))
+
+
+class GradeStats:
+    """
+    Running aggregates over the grade scores.
+
+    Sum, count, mean and variance (Welford) plus per-category sums are updated in
+    O(1) per add/remove; a bisect-maintained sorted list of scores answers min, max,
+    median and percentiles without ever re-sorting.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0            # Sum of squared deviations from the mean
+        self.sorted_scores = []
+        self.by_category = {}     # category -> [total, count]
+
+    def add(self, score, category="General"):
+        self.count += 1
+        self.total += score
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        insort(self.sorted_scores, score)
+
+        category_totals = self.by_category.setdefault(category, [0.0, 0])
+        category_totals[0] += score
+        category_totals[1] += 1
+
+    def remove(self, score, category="General"):
+        if self.count <= 1:
+            self.count, self.total, self.mean, self._m2 = 0, 0.0, 0.0, 0.0
+        else:
+            # Welford's update run backwards
+            old_mean = self.mean
+            self.count -= 1
+            self.total -= score
+            self.mean = old_mean - (score - old_mean) / self.count
+            self._m2 = max(0.0, self._m2 - (score - self.mean) * (score - old_mean))
+        del self.sorted_scores[bisect_left(self.sorted_scores, score)]
+
+        category_totals = self.by_category[category]
+        category_totals[0] -= score
+        category_totals[1] -= 1
+        if category_totals[1] == 0:
+            del self.by_category[category]
+
+    def replace(self, old_score, old_category, new_score, new_category):
+        self.remove(old_score, old_category)
+        self.add(new_score, new_category)
+
+    @property
+    def minimum(self):
+        return self.sorted_scores[0] if self.sorted_scores else None
+
+    @property
+    def maximum(self):
+        return self.sorted_scores[-1] if self.sorted_scores else None
+
+    @property
+    def std_dev(self):
+        """Population standard deviation of the scores."""
+        return (self._m2 / self.count) ** 0.5 if self.count else None
+
+    def percentile(self, percent):
+        """Linearly interpolated percentile (0-100) of the scores."""
+        if not self.sorted_scores:
+            return None
+        position = (len(self.sorted_scores) - 1) * percent / 100
+        lower = int(position)
+        upper = min(lower + 1, len(self.sorted_scores) - 1)
+        fraction = position - lower
+        return self.sorted_scores[lower] * (1 - fraction) + self.sorted_scores[upper] * fraction
+
+    @property
+    def median(self):
+        return self.percentile(50)
+
+    def category_averages(self):
+        return {category: total / count for category, (total, count) in self.by_category.items()}
+
+    def weighted_average(self, weights=CATEGORY_WEIGHTS):
+        """Average of the category means, weighted by each category's weight."""
+        weighted_sum = 0.0
+        weight_total = 0.0
+        for category, average in self.category_averages().items():
+            weight = weights.get(category, weights.get("General", 1))
+            weighted_sum += weight * average
+            weight_total += weight
+        return weighted_sum / weight_total if weight_total else None
+
+
+def first_date_on_or_after(month, day, start):
+    """The first month/day date on or after start, or None if the pair never exists."""
+    for year in range(start.year, start.year + 5): # 02/29 can be four years out
+        try:
+            candidate = date(year, month, day)
+        except ValueError:
+            continue
+        if candidate >= start:
+            return candidate
+    return None
+
+
+def make_due_date(month, day, today=None):
+    """
+    Builds the due date for a month/day pair, or returns None if it doesn't exist.
+
+    The year is inferred as the one that puts the date closest to today, so in
+    December "01/10" means next January and in January "12/20" means last December.
+    "02/29" falls on the nearest leap year.
+    """
+    today = today or date.today()
+    # Every leap year is within four years of today
+    for year in sorted(range(today.year - 4, today.year + 5),
+                       key=lambda year: abs((year - today.year) * 12 + month - today.month)):
+        try:
+            return date(year, month, day)
+        except ValueError:
+            continue
+    return None
+
+
+TERM_SEASONS = ("Spring", "Summer", "Fall") # In calendar order
+
+
+def current_term(today=None):
+    """The academic term a date falls in: "Spring YYYY" (Jan-May), "Summer YYYY" (Jun-Jul) or "Fall YYYY"."""
+    today = today or date.today()
+    season = "Spring" if today.month <= 5 else "Summer" if today.month <= 7 else "Fall"
+    return f"{season} {today.year}"
+
+
+def term_sort_key(term):
+    """Chronological sort key for term names; no term sorts first, unrecognised names last, by name."""
+    if not term:
+        return (-1, 0, 0, "")
+    season, _, year = term.rpartition(" ")
+    if season.title() in TERM_SEASONS and year.isdigit():
+        return (0, int(year), TERM_SEASONS.index(season.title()), "")
+    return (1, 0, 0, term)
+
+
+def parse_due_date(month_str, day_str):
+    """Validates month/day input; returns the due date or raises ValueError with a user-facing message."""
+    try:
+        month = int(month_str)
+        day = int(day_str)
+    except ValueError:
+        raise ValueError("Date input must be valid numbers for Month and Day.") from None
+
+    # Basic validation for month/day using if statement
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        raise ValueError("Date validation failed: Month (1-12) or Day (1-31) is invalid.")
+
+    due = make_due_date(month, day)
+    if due is None:
+        raise ValueError(f"Date validation failed: {month:02d}/{day:02d} does not exist.")
+    return due
+
+
+def parse_score(score_str):
+    """Validates score input; returns the score or raises ValueError with a user-facing message."""
+    try:
+        score = float(score_str)
+    except ValueError:
+        raise ValueError("Grades must be entered as a number (0-100).") from None
+
+    # Use an if statement to check the score range
+    if not (0.0 <= score <= 100.0):
+        raise ValueError("Grade must be a number between 0 and 100.")
+    return score
+
+
+def parse_recurrence(every_str, until_str, due):
+    """
+    Validates repeat input for an item due on due; returns a Recurrence, or None
+    for a one-off item, or raises ValueError with a user-facing message.
+
+    every_str is the number of days between occurrences ("0" or blank: no repeat);
+    until_str is an optional end date as MM/DD (the first such date on or after
+    due) or YYYY-MM-DD.
+    """
+    every_str, until_str = every_str.strip(), until_str.strip()
+    if not every_str or every_str == "0":
+        if until_str and every_str != "0":
+            raise ValueError("Enter how many days apart the item repeats.")
+        return None
+    try:
+        interval = int(every_str)
+    except ValueError:
+        interval = 0
+    if not (1 <= interval <= 365):
+        raise ValueError("Repeat interval must be a whole number of days (1-365).")
+
+    until = None
+    if until_str:
+        try:
+            if "-" in until_str:
+                until = date.fromisoformat(until_str)
+            else:
+                month, _, day = until_str.partition("/")
+                until = first_date_on_or_after(int(month), int(day), due)
+        except ValueError:
+            until = None
+        if until is None:
+            raise ValueError("Repeat end date must be a valid MM/DD date.")
+        if until < due:
+            raise ValueError("Repeat end date must be on or after the due date.")
+    return Recurrence(interval, until)
+
+def reserve_item_ids(max_id):
+    """Makes sure newly created items get IDs above max_id (e.g. after loading)."""
+    global _item_ids
+    with _item_ids_lock:
+        next_id = next(_item_ids)
+        _item_ids = itertools.count(max(next_id, max_id + 1))
+
+
+# --- Storage ---
+class ItemStorage:
+    """
+    Crash-safe SQLite persistence for items, with debounced autosave.
+
+    save()/delete() only enqueue the change; a background thread owns all disk
+    I/O. Changes arriving within BATCH_WINDOW are coalesced (last write per item
+    wins) and appended to a journal file that is fsync'd before anything else,
+    so an acknowledged change survives a crash. The database (WAL mode, indexes
+    on kind, due date and score) acts as the snapshot: once changes stop for
+    IDLE_DELAY, or the journal grows past COMPACT_BYTES, everything journaled
+    since the last snapshot is committed in one transaction and the journal is
+    truncated. On open, a leftover journal is replayed (its operations are
+    idempotent), and since it never grows much past COMPACT_BYTES, recovery
+    time is bounded however long the last session ran.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS items (
+            id INTEGER PRIMARY KEY,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            due TEXT,
+            score REAL,
+            category TEXT NOT NULL DEFAULT 'General',
+            term TEXT NOT NULL DEFAULT '',
+            recurrence TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_items_kind ON items (kind);
+        CREATE INDEX IF NOT EXISTS idx_items_due ON items (due);
+        CREATE INDEX IF NOT EXISTS idx_items_score ON items (score);
+    """
+    ADDED_COLUMNS = {"term": "TEXT NOT NULL DEFAULT ''", "recurrence": "TEXT"}
+    BATCH_WINDOW = 0.2       # Seconds to keep collecting changes into one journal append
+    IDLE_DELAY = 2.0         # Quiet seconds before journaled changes are written to the database
+    COMPACT_BYTES = 1 << 20  # Journal size that forces a database write (bounds recovery time)
+
+    def __init__(self, path=DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_path = self.path.with_name(self.path.name + ".journal")
+        self.error = None # Last error raised by the writer thread, if any (cleared by whoever reports it)
+
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executescript(self.SCHEMA)
+                # Databases created by earlier versions lack the newer columns
+                columns = {row[1] for row in connection.execute("PRAGMA table_info(items)")}
+                for column, definition in self.ADDED_COLUMNS.items():
+                    if column not in columns:
+                        connection.execute(f"ALTER TABLE items ADD COLUMN {column} {definition}")
+                if "term" not in columns:
+                    # Grades stored before terms existed count toward the current one (like blank input)
+                    connection.execute("UPDATE items SET term = ? WHERE kind = ?",
+                                       (current_term(), ItemKind.GRADE.value))
+            self.recovered = self._replay_journal(connection) # Changes rescued from an unclean exit
+        finally:
+            connection.close()
+
+        self._journal = open(self.journal_path, "ab")
+        self._journal_bytes = 0
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="ItemStorage writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Commits are rare (debounced) and the journal is dropped right after them,
+        # so they must be durable
+        connection.execute("PRAGMA synchronous=FULL")
+        return connection
+
+    def load(self):
+        """Reads every stored item (in insertion order) and reserves their IDs."""
+        connection = self._connect()
+        try:
+            rows = connection.execute(
+                "SELECT id, kind, name, due, score, category, term, recurrence FROM items ORDER BY id").fetchall()
+        finally:
+            connection.close()
+
+        items = [Item(ItemKind(kind), name, due=date.fromisoformat(due) if due else None,
+                      score=score, category=category, term=term,
+                      recurrence=Recurrence.from_text(recurrence) if recurrence else None, id=item_id)
+                 for item_id, kind, name, due, score, category, term, recurrence in rows]
+        if items:
+            reserve_item_ids(items[-1].id)
+        return items
+
+    @staticmethod
+    def _row(item):
+        return (item.id, item.kind.value, item.name,
+                item.due.isoformat() if item.due else None, item.score, item.category, item.term,
+                item.recurrence.to_text() if item.recurrence else None)
+
+    def save(self, item):
+        """Queues an insert-or-update of the item."""
+        self._queue.put(("save", [self._row(item)]))
+
+    def save_many(self, items):
+        """Queues an insert-or-update of several items as a single operation."""
+        self._queue.put(("save", [self._row(item) for item in items]))
+
+    def delete(self, item_id):
+        """Queues the removal of the item with the given ID."""
+        self._queue.put(("delete", (item_id,)))
+
+    def flush(self):
+        """Blocks until every queued change is durable (journaled)."""
+        self._queue.join()
+
+    def close(self):
+        """Writes any pending changes to the database and stops the writer thread."""
+        self._queue.put(None)
+        self._writer.join()
+
+    # --- Journal ---
+    @staticmethod
+    def _apply(connection, changes):
+        """Writes {item_id: row or None (deleted)} in one transaction."""
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO items (id, kind, name, due, score, category, term, recurrence) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [row for row in changes.values() if row is not None])
+            connection.executemany("DELETE FROM items WHERE id = ?",
+                                   [(item_id,) for item_id, row in changes.items() if row is None])
+
+    def _replay_journal(self, connection):
+        """Applies a journal left by a crashed session; returns how many changes it held."""
+        if not self.journal_path.exists():
+            return 0
+        changes = {}
+        with open(self.journal_path, "rb") as journal:
+            for line in journal:
+                try:
+                    item_id, row = json.loads(line)
+                except ValueError:
+                    break # A torn final line: the change never finished being journaled
+                changes[item_id] = tuple(row) if row is not None else None
+        if changes:
+            self._apply(connection, changes)
+        self._truncate_journal()
+        return len(changes)
+
+    def _truncate_journal(self):
+        with open(self.journal_path, "wb") as journal:
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _append_journal(self, changes):
+        data = "".join(json.dumps([item_id, row]) + "\n" for item_id, row in changes.items()).encode("utf-8")
+        self._journal.write(data)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_bytes += len(data)
+
+    def _snapshot(self, connection, pending):
+        """Commits the changes journaled since the last snapshot, then empties the journal."""
+        if pending:
+            self._apply(connection, pending)
+            pending.clear()
+        self._journal.truncate(0)
+        self._journal.flush()
+        os.fsync(self._journal.fileno())
+        self._journal_bytes = 0
+
+    def _write_loop(self):
+        connection = self._connect()
+        pending = {} # item_id -> row (None when deleted) journaled but not yet in the database
+        running = True
+        while running:
+            try:
+                # Block until there is something to write, or until the changes go quiet
+                batch = [self._queue.get(timeout=self.IDLE_DELAY if pending else None)]
+            except queue.Empty:
+                try:
+                    self._snapshot(connection, pending)
+                except (OSError, sqlite3.Error) as error:
+                    self.error = error
+                continue
+
+            deadline = time.monotonic() + self.BATCH_WINDOW
+            while batch[-1] is not None:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            if batch[-1] is None:
+                running = False
+
+            changes = {} # Coalesced: only the last change per item is journaled
+            for operation in batch:
+                if operation is None:
+                    continue
+                action, values = operation
+                if action == "save":
+                    for row in values:
+                        changes[row[0]] = row
+                else:
+                    changes[values[0]] = None
+
+            pending.update(changes) # Kept even if journaling fails, so a snapshot still writes them
+            try:
+                if changes:
+                    self._append_journal(changes)
+                if not running or self._journal_bytes >= self.COMPACT_BYTES:
+                    self._snapshot(connection, pending)
+            except (OSError, sqlite3.Error) as error:
+                self.error = error
+                # A failed append may leave a torn line that would hide later ones on
+                # replay, so write straight to the database (which empties the journal)
+                try:
+                    self._snapshot(connection, pending)
+                except (OSError, sqlite3.Error):
+                    pass # Still pending; retried at the next snapshot
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        self._journal.close()
+        connection.close()
+
+
+# --- Import / Export ---
+# Columns of the CSV format; JSON Lines records use the same keys. Exports carry
+# the full ISO due date; imports also accept month/day columns (year inferred).
+ITEM_FIELDS = ("kind", "name", "due", "score", "category", "term", "repeat_days", "until")
+IMPORT_CHUNK_SIZE = 2000
+
+
+def _counted_lines(file, counter):
+    """Yields the lines of a text file while tallying their encoded size in counter[0]."""
+    for line in file:
+        counter[0] += len(line.encode("utf-8"))
+        yield line
+
+
+def _iter_records(path, counter):
+    """Streams (line_number, record) pairs from a CSV or JSON Lines file."""
+    with open(path, newline="", encoding="utf-8-sig") as file: # utf-8-sig: Excel starts CSVs with a BOM
+        lines = _counted_lines(file, counter)
+        if Path(path).suffix.lower() in (".jsonl", ".ndjson", ".json"):
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as error:
+                    record = ValueError(f"Invalid JSON ({error.msg}).")
+                yield line_number, record
+        else:
+            reader = csv.DictReader(lines)
+            for record in reader:
+                yield reader.line_num, record
+
+
+def item_from_record(record):
+    """Builds an Item from an import record, applying the same validation as the input form."""
+    if not isinstance(record, dict):
+        raise ValueError("Record must be an object with the item fields.")
+
+    kind_str = str(record.get("kind") or "").strip().title()
+    try:
+        kind = ItemKind(kind_str)
+    except ValueError:
+        raise ValueError(f"Unknown item kind '{kind_str}'.") from None
+
+    name = str(record.get("name") or "").strip()
+    if not name:
+        raise ValueError("Item name cannot be empty.")
+
+    if kind is ItemKind.GRADE:
+        score = parse_score(str(record.get("score", "")).strip())
+        category = str(record.get("category") or "").strip() or "General"
+        term = str(record.get("term") or "").strip() or current_term()
+        return Item(kind, name, score=score, category=category, term=term)
+
+    due_str = str(record.get("due") or "").strip()
+    if due_str:
+        try:
+            due = date.fromisoformat(due_str)
+        except ValueError:
+            raise ValueError("Due date must be a valid YYYY-MM-DD date.") from None
+    else:
+        due = parse_due_date(str(record.get("month", "")).strip(), str(record.get("day", "")).strip())
+    recurrence = parse_recurrence(str(record.get("repeat_days") or ""), str(record.get("until") or ""), due)
+    return Item(kind, name, due=due, recurrence=recurrence)
+
+
+def iter_item_chunks(path, chunk_size=IMPORT_CHUNK_SIZE):
+    """
+    Streams validated items from a CSV or JSON Lines file.
+
+    Yields (items, errors, fraction_done) per chunk of up to chunk_size rows, where
+    errors lists (line_number, message) for the rows that failed validation. Only
+    one chunk is held in memory at a time.
+    """
+    total_bytes = max(1, Path(path).stat().st_size)
+    counter = [0]
+    items = []
+    errors = []
+
+    for line_number, record in _iter_records(path, counter):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            items.append(item_from_record(record))
+        except ValueError as error:
+            errors.append((line_number, str(error)))
+
+        if len(items) + len(errors) >= chunk_size:
+            yield items, errors, counter[0] / total_bytes
+            items = []
+            errors = []
+
+    yield items, errors, 1.0
+
+
+def item_to_record(item):
+    """The export record for an item (inverse of item_from_record)."""
+    return {"kind": item.kind.value, "name": item.name,
+            "due": item.due.isoformat() if item.due else "",
+            "score": item.score if item.score is not None else "",
+            "category": item.category if item.kind is ItemKind.GRADE else "",
+            "term": item.term,
+            "repeat_days": item.recurrence.interval if item.recurrence else "",
+            "until": item.recurrence.until.isoformat() if item.recurrence and item.recurrence.until else ""}
+
+
+def export_items(path, items):
+    """Streams items to a CSV or JSON Lines file (by extension); returns how many were written."""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        if Path(path).suffix.lower() in (".jsonl", ".ndjson", ".json"):
+            for item in items:
+                record = {key: value for key, value in item_to_record(item).items() if value != ""}
+                file.write(json.dumps(record) + "\n")
+                count += 1
+        else:
+            writer = csv.DictWriter(file, fieldnames=ITEM_FIELDS)
+            writer.writeheader()
+            for item in items:
+                writer.writerow(item_to_record(item))
+                count += 1
+    return count
+
+
+# --- Undo / Redo History ---
+def item_row(item):
+    """Compact, immutable copy of an item's fields (what the history stores)."""
+    return (item.kind, item.name, item.due, item.score, item.category, item.term, item.recurrence)
+
+
+class HistoryEntry:
+    """
+    One undoable step: a delta {item_id: (before_row, after_row)}.
+
+    A None before_row means the item was added, a None after_row that it was
+    deleted; otherwise it was modified. Only touched items appear.
+    """
+
+    __slots__ = ("label", "delta", "group")
+
+    def __init__(self, label, delta, group=None):
+        self.label = label
+        self.delta = delta
+        self.group = group
+
+    def merge(self, newer):
+        """Folds a later entry in, keeping each item's oldest before and newest after."""
+        for item_id, (before, after) in newer.delta.items():
+            if item_id in self.delta:
+                before = self.delta[item_id][0]
+            if before is None and after is None:
+                self.delta.pop(item_id, None) # Added then deleted: no net change
+            else:
+                self.delta[item_id] = (before, after)
+
+
+class History:
+    """
+    Undo/redo log of compact deltas rather than copies of the lists.
+
+    The newest RECENT_LIMIT steps are kept individually. Older steps are folded,
+    SNAPSHOT_INTERVAL at a time, into snapshot entries that hold only the net
+    change of that span, so undoing deep into a long session costs the size of
+    the net change rather than the number of steps. The oldest snapshots are
+    dropped past SNAPSHOT_LIMIT, or when the log holds more than ROW_LIMIT rows.
+    """
+
+    RECENT_LIMIT = 100
+    SNAPSHOT_INTERVAL = 25
+    SNAPSHOT_LIMIT = 20
+    ROW_LIMIT = 250_000
+
+    def __init__(self):
+        self.undo_stack = deque() # Oldest first: snapshot entries, then recent steps
+        self.redo_stack = []
+        self.recent = 0           # Individual (not yet folded) steps at the top of undo_stack
+        self.rows = 0             # Total delta rows held in undo_stack
+        self.dropped_group = None # Group whose step outgrew ROW_LIMIT (its later parts aren't kept)
+
+    def record(self, label, delta, group=None):
+        """Adds a step; consecutive steps with the same non-None group become one."""
+        if not delta:
+            return
+        self.redo_stack.clear()
+        if group is not None and group == self.dropped_group:
+            return # Undoing only the tail of the step would leave it half applied
+        self.dropped_group = None
+        last = self.undo_stack[-1] if self.recent else None
+        if group is not None and last is not None and last.group == group:
+            self.rows -= len(last.delta)
+            last.merge(HistoryEntry(label, delta))
+            last.label = label
+            self.rows += len(last.delta)
+            self._compact() # A growing group (e.g. an import) counts against ROW_LIMIT too
+            return
+
+        self.undo_stack.append(HistoryEntry(label, delta, group))
+        self.recent += 1
+        self.rows += len(delta)
+        self._compact()
+
+    def _compact(self):
+        if self.recent > self.RECENT_LIMIT:
+            # Fold the oldest individual steps into one snapshot entry
+            first = len(self.undo_stack) - self.recent
+            span = [self.undo_stack[first + offset] for offset in range(self.SNAPSHOT_INTERVAL)]
+            snapshot = HistoryEntry(f"{len(span)} earlier changes", dict(span[0].delta))
+            for entry in span[1:]:
+                snapshot.merge(entry)
+            for _ in span:
+                del self.undo_stack[first]
+            self.undo_stack.insert(first, snapshot)
+            self.recent -= len(span)
+            self.rows += len(snapshot.delta) - sum(len(entry.delta) for entry in span)
+
+        snapshots = len(self.undo_stack) - self.recent
+        while self.undo_stack and (snapshots > self.SNAPSHOT_LIMIT or self.rows > self.ROW_LIMIT):
+            dropped = self.undo_stack.popleft()
+            self.rows -= len(dropped.delta)
+            if dropped.group is not None and not self.undo_stack:
+                self.dropped_group = dropped.group
+            if snapshots:
+                snapshots -= 1
+            else:
+                self.recent -= 1
+
+    def pop_undo(self):
+        """The step to undo (moved onto the redo stack), or None."""
+        if not self.undo_stack:
+            return None
+        entry = self.undo_stack.pop()
+        self.rows -= len(entry.delta)
+        if self.recent:
+            self.recent -= 1
+        entry.group = None # A redone step never merges with later ones
+        self.redo_stack.append(entry)
+        return entry
+
+    def pop_redo(self):
+        """The step to redo (moved back onto the undo stack), or None."""
+        if not self.redo_stack:
+            return None
+        entry = self.redo_stack.pop()
+        self.undo_stack.append(entry)
+        self.recent += 1
+        self.rows += len(entry.delta)
+        return entry
+
+
+# --- Core Engine ---
+def _series(item, start, end):
+    """(date, item) for a recurring item's occurrences in [start, end)."""
+    for day in item.recurrence.occurrences(item.due, start, end):
+        yield day, item
+
+
+
+class OrganizerCore:
+    """
+    The organizer's data and operations, independent of any UI.
+
+    Holds one ItemCollection per kind plus the running GradeStats, validates raw
+    (string) input exactly like the input form, and mirrors every change to an
+    optional ItemStorage. Invalid input raises ValueError with a user-facing
+    message.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage
+        self.collections = {kind: ItemCollection(kind) for kind in ItemKind}
+        self.grade_stats = GradeStats()
+        self.history = History()
+
+    def __len__(self):
+        return sum(len(collection) for collection in self.collections.values())
+
+    def get(self, item_id):
+        """The item with the given ID, or None."""
+        for collection in self.collections.values():
+            item = collection.get(item_id)
+            if item is not None:
+                return item
+        return None
+
+    def all_items(self):
+        """Snapshot list of every item (safe to hand to another thread)."""
+        return list(itertools.chain.from_iterable(self.collections.values()))
+
+    def add_loaded(self, items):
+        """Adds items that came from storage (without writing them back); returns the kinds touched."""
+        kinds = set()
+        for item in items:
+            self.collections[item.kind].add(item)
+            if item.score is not None:
+                self.grade_stats.add(item.score, item.category)
+            kinds.add(item.kind)
+        return kinds
+
+    def load(self):
+        """Loads every stored item; returns the kinds that received items."""
+        if self.storage is None:
+            return set()
+        return self.add_loaded(self.storage.load())
+
+    def add(self, kind, name, month="", day="", score="", category="", term="", repeat="", until=""):
+        """Validates raw input, adds the new item and returns it."""
+        try:
+            kind = ItemKind(kind)
+        except ValueError:
+            raise ValueError("Invalid item type selected.") from None
+
+        name = name.strip()
+        if not name:
+            raise ValueError("Item name cannot be empty.")
+
+        if kind is ItemKind.GRADE:
+            item = Item(kind, name, score=parse_score(str(score).strip()),
+                        category=category.strip() or "General", term=term.strip() or current_term())
+        else:
+            due = parse_due_date(str(month).strip(), str(day).strip())
+            item = Item(kind, name, due=due, recurrence=parse_recurrence(repeat, until, due))
+
+        self.add_items([item], label=f"add '{name}'")
+        return item
+
+    def add_items(self, items, label=None, group=None, record=True):
+        """
+        Adds already-validated items (e.g. an import chunk) as one storage batch.
+
+        The addition is one undo step (consecutive calls sharing a group merge
+        into a single step). Returns the kinds touched.
+        """
+        kinds = self.add_loaded(items)
+        if self.storage is not None and items:
+            self.storage.save_many(items)
+        if record:
+            self.history.record(label or f"add {len(items)} items",
+                                {item.id: (None, item_row(item)) for item in items}, group)
+        return kinds
+
+    def modify(self, item_ids, name="", month="", day="", score="", category="", term="", repeat="", until=""):
+        """
+        Applies the filled-in fields to every given item (all of one kind).
+
+        Blank fields are left unchanged (a repeat of "0" stops repeating).
+        Returns the modified items.
+        """
+        items = [item for item in map(self.get, item_ids) if item is not None]
+        if not items:
+            raise ValueError("Select an item to modify first.")
+        kind = items[0].kind
+        if any(item.kind is not kind for item in items):
+            raise ValueError("Only items of one type can be modified together.")
+
+        name, month, day, score = name.strip(), str(month).strip(), str(day).strip(), str(score).strip()
+        repeat, until = str(repeat).strip(), str(until).strip()
+        changes_term = kind is ItemKind.GRADE and term.strip()
+        changes_category = kind is ItemKind.GRADE and category.strip() and any(
+            item.category != category.strip() for item in items)
+        changes_repeat = kind is not ItemKind.GRADE and (repeat or until)
+        if not (name or month or day or score or changes_term or changes_category or changes_repeat):
+            raise ValueError("Enter new values to modify the item.")
+
+        new_due = None
+        new_score = None
+        new_category = None
+        new_term = None
+        if kind is ItemKind.GRADE:
+            if score: # Only validate the score if it was filled in
+                new_score = parse_score(score)
+            new_category = category.strip() or None
+            new_term = term.strip() or None
+        elif month or day: # Only validate the date if it was touched
+            new_due = parse_due_date(month, day)
+
+        # Validate every item's repeat rule before changing any of them
+        recurrences = {}
+        if changes_repeat:
+            recurrences = {item.id: parse_recurrence(repeat, until, new_due or item.due) for item in items}
+        elif new_due is not None and any(item.recurrence is not None and item.recurrence.until is not None
+                                         and item.recurrence.until < new_due for item in items):
+            raise ValueError("Repeat end date must be on or after the due date.")
+
+        collection = self.collections[kind]
+        delta = {}
+        for item in items:
+            before = item_row(item)
+            collection.update_item(item, name=name or None, due=new_due, score=new_score,
+                                   category=new_category, term=new_term,
+                                   recurrence=recurrences.get(item.id, item.recurrence))
+            if item.score is not None:
+                self.grade_stats.replace(before[3], before[4], item.score, item.category)
+            delta[item.id] = (before, item_row(item))
+        if self.storage is not None:
+            self.storage.save_many(items)
+        self.history.record(f"modify {len(items)} item(s)", delta)
+        return items
+
+    def delete(self, item_ids):
+        """Removes the given items; returns the ones that existed."""
+        removed = []
+        for item_id in item_ids:
+            for collection in self.collections.values():
+                item = collection.remove(item_id)
+                if item is not None:
+                    break
+            else:
+                continue
+            if item.score is not None:
+                self.grade_stats.remove(item.score, item.category)
+            if self.storage is not None:
+                self.storage.delete(item_id)
+            removed.append(item)
+        self.history.record(f"delete {len(removed)} item(s)", {item.id: (item_row(item), None) for item in removed})
+        return removed
+
+    def _apply_rows(self, rows):
+        """Makes each item_id match its row (None deletes it); returns the kinds touched."""
+        kinds = set()
+        saved = []
+        for item_id, row in rows.items():
+            item = self.get(item_id)
+            if row is None:
+                if item is not None:
+                    self.collections[item.kind].remove(item_id)
+                    if item.score is not None:
+                        self.grade_stats.remove(item.score, item.category)
+                    if self.storage is not None:
+                        self.storage.delete(item_id)
+                    kinds.add(item.kind)
+                continue
+
+            kind, name, due, score, category, term, recurrence = row
+            if item is None:
+                item = Item(kind, name, due=due, score=score, category=category, term=term,
+                            recurrence=recurrence, id=item_id)
+                self.collections[kind].add(item)
+                if score is not None:
+                    self.grade_stats.add(score, category)
+            else:
+                old_score, old_category = item.score, item.category
+                self.collections[kind].update_item(item, name=name, due=due, score=score,
+                                                   category=category, term=term, recurrence=recurrence)
+                if score is not None:
+                    self.grade_stats.replace(old_score, old_category, score, category)
+            saved.append(item)
+            kinds.add(kind)
+
+        if self.storage is not None and saved:
+            self.storage.save_many(saved)
+        return kinds
+
+    def undo(self):
+        """Reverts the latest step; returns (label, kinds touched) or None if there is nothing to undo."""
+        entry = self.history.pop_undo()
+        if entry is None:
+            return None
+        return entry.label, self._apply_rows({item_id: before for item_id, (before, _) in entry.delta.items()})
+
+    def redo(self):
+        """Re-applies the latest undone step; returns (label, kinds touched) or None."""
+        entry = self.history.pop_redo()
+        if entry is None:
+            return None
+        return entry.label, self._apply_rows({item_id: after for item_id, (_, after) in entry.delta.items()})
+
+    def _occurrence_streams(self, start, end, kinds):
+        """Per-source (date, item) generators over [start, end), each in date order."""
+        streams = []
+        for kind in kinds:
+            collection = self.collections[kind]
+            streams.append((item.due, item) for item in collection.by_due(start, end))
+            streams.extend(_series(item, start, end) for item in collection.recurring.values()
+                           if item.due < end and (item.recurrence.until is None or item.recurrence.until >= start))
+        return streams
+
+    def occurrences(self, start, end, kinds=(ItemKind.ASSIGNMENT, ItemKind.EXAM)):
+        """
+        Lazily yields (date, item) for every occurrence in [start, end), in date order.
+
+        One-off items come straight from the due-date index; each recurring item
+        is expanded by its rule over the window only, so the cost follows the
+        window, not the length of the series.
+        """
+        return heapq.merge(*self._occurrence_streams(start, end, kinds),
+                           key=lambda occurrence: (occurrence[0], occurrence[1].id))
+
+    def occurrences_by_date(self, start, end, kinds=(ItemKind.ASSIGNMENT, ItemKind.EXAM)):
+        """{date: [items in ID order]} for the occurrences in [start, end) (what a calendar page needs)."""
+        by_date = {}
+        for stream in self._occurrence_streams(start, end, kinds):
+            for day, item in stream:
+                by_date.setdefault(day, []).append(item)
+        for items in by_date.values():
+            items.sort(key=lambda item: item.id)
+        return by_date
+
+    def query(self, kind, search="", filter="All", days=7, sort=False, today=None):
+        """
+        The items of one kind to display, as an indexable sequence.
+
+        filter is "All", "Upcoming" (due within the next days days) or "Overdue";
+        the date filters and sort=True order by due date, taking a repeating
+        item's next occurrence (Item.next_due) as its due date. A search string
+        keeps only the items matching every word as a prefix.
+        """
+        collection = self.collections[kind]
+        dated = collection.due_index is not None
+        today = today or date.today()
+        end = today + timedelta(days=days + 1)
+
+        def wanted(item):
+            due = item.next_due(today)
+            if filter == "Upcoming":
+                return today <= due < end
+            if filter == "Overdue":
+                return due < today
+            return True
+
+        def due_key(item):
+            return item.next_due(today), item.id
+
+        if search:
+            matches = collection.search(search)
+            if not dated or (filter == "All" and not sort):
+                return matches
+            matches = [item for item in matches if wanted(item)]
+            matches.sort(key=due_key)
+            return matches
+
+        if not dated or (filter == "All" and not sort):
+            return collection.ordered()
+        if filter == "Upcoming":
+            view = collection.by_due(today, end)
+        elif filter == "Overdue":
+            view = collection.by_due(end=today)
+        else:
+            view = collection.by_due()
+        if not collection.recurring:
+            return view
+        # Repeating items aren't in the due-date index; splice them in by their next occurrence
+        repeating = sorted((item for item in collection.recurring.values() if wanted(item)), key=due_key)
+        return MergedItemView(view, repeating, [due_key(item) for item in repeating])
+
+    def close(self):
+        """Flushes and closes the storage, if any."""
+        if self.storage is not None:
+            self.storage.close()
+
+
+# --- Profiles ---
+class ProfileManager:
+    """
+    Named student profiles, each sharded into its own SQLite database.
+
+    A profile's OrganizerCore is only built when it is first opened (load() is
+    safe to run on a worker thread) and then kept in an LRU of loaded profiles.
+    Whenever more than max_loaded profiles are open, or their estimated footprint
+    goes over memory_budget, the least recently used ones other than the active
+    profile are closed (flushing their pending writes) and dropped.
+    """
+
+    MEMORY_BUDGET = 256 * 2**20 # Bytes of loaded profile data to keep in memory
+    ITEM_BYTES = 2048           # Rough in-memory cost of one item with its index entries
+    PROFILE_BYTES = 2 * 2**20   # Fixed cost of an open profile (indexes, SQLite cache, writer thread)
+    MAX_LOADED = 8              # Open profiles (each holds a writer thread and a journal file)
+
+    def __init__(self, default_path=DB_PATH, profiles_dir=PROFILES_DIR, memory_budget=MEMORY_BUDGET,
+                 max_loaded=MAX_LOADED):
+        self.default_path = Path(default_path)
+        self.profiles_dir = Path(profiles_dir)
+        self.memory_budget = memory_budget
+        self.max_loaded = max_loaded
+        self.loaded = OrderedDict() # name -> OrganizerCore, least recently used first
+        self.active = None
+
+    def path(self, name):
+        """The database file of a profile (names are percent-encoded into the file name)."""
+        if name == DEFAULT_PROFILE:
+            return self.default_path
+        return self.profiles_dir / f"{quote(name, safe=' ')}.db"
+
+    def names(self):
+        """Every known profile name, the default one first."""
+        stored = {unquote(path.stem) for path in self.profiles_dir.glob("*.db")} if self.profiles_dir.is_dir() else set()
+        return [DEFAULT_PROFILE] + sorted(stored - {DEFAULT_PROFILE}, key=str.casefold)
+
+    def load(self, name):
+        """Opens and reads a profile's database into a new OrganizerCore (no shared state touched)."""
+        core = OrganizerCore(ItemStorage(self.path(name)))
+        core.load()
+        return core
+
+    def add(self, name, core):
+        """Registers a core returned by load(); if the profile was loaded meanwhile, keeps that one."""
+        if name in self.loaded:
+            core.close()
+            return self.loaded[name]
+        self.loaded[name] = core
+        return core
+
+    def activate(self, name):
+        """Makes a loaded profile the active (most recently used) one and enforces the memory budget."""
+        self.loaded.move_to_end(name)
+        self.active = name
+        self._evict()
+        return self.loaded[name]
+
+    def estimated_bytes(self):
+        return sum(len(core) * self.ITEM_BYTES + self.PROFILE_BYTES for core in self.loaded.values())
+
+    def _evict(self):
+        while len(self.loaded) > self.max_loaded or self.estimated_bytes() > self.memory_budget:
+            idle = next((name for name in self.loaded if name != self.active), None)
+            if idle is None:
+                break
+            self.loaded.pop(idle).close()
+
+    def close(self):
+        """Closes every loaded profile, flushing pending writes."""
+        for core in self.loaded.values():
+            core.close()
+        self.loaded.clear()
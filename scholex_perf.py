@@ -0,0 +1,139 @@
+"""
+Opt-in hot-path instrumentation for the Student Organization Tool.
+
+Functions wrapped with @instrumented(name) record their duration with
+time.perf_counter_ns() while perf.enabled is set (and cost a single flag
+check otherwise). Samples go to bounded per-probe buffers used for p50/p99
+summaries and to a bounded event list exportable as a Chrome/Perfetto JSON
+trace. cProfile and tracemalloc capture can be switched on alongside.
+"""
+from collections import deque
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+
+class Instrumentation:
+    """Collects timing samples per probe name."""
+
+    SAMPLE_LIMIT = 2048   # Samples kept per probe for percentiles
+    TRACE_LIMIT = 50_000  # Events kept for the JSON trace
+
+    def __init__(self):
+        self.enabled = False
+        self.samples = {}  # name -> deque of durations in ns
+        self.counts = {}   # name -> total calls recorded
+        self.events = deque(maxlen=self.TRACE_LIMIT)
+        self._origin_ns = time.perf_counter_ns()
+        self._profiler = None
+
+    def record(self, name, start_ns, end_ns):
+        """Adds one sample (timestamps from time.perf_counter_ns())."""
+        samples = self.samples.get(name)
+        if samples is None:
+            samples = self.samples[name] = deque(maxlen=self.SAMPLE_LIMIT)
+            self.counts[name] = 0
+        samples.append(end_ns - start_ns)
+        self.counts[name] += 1
+        self.events.append((name, start_ns, end_ns, threading.get_ident()))
+
+    def reset(self):
+        self.samples.clear()
+        self.counts.clear()
+        self.events.clear()
+
+    @staticmethod
+    def _percentile(ordered, percent):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    def summary(self):
+        """{name: {"count", "p50_ms", "p99_ms", "max_ms"}} over the kept samples."""
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[name] = {"count": self.counts[name],
+                            "p50_ms": self._percentile(ordered, 50) / 1e6,
+                            "p99_ms": self._percentile(ordered, 99) / 1e6,
+                            "max_ms": ordered[-1] / 1e6}
+        return result
+
+    # --- Optional cProfile / tracemalloc capture ---
+    @property
+    def profiling(self):
+        return self._profiler is not None
+
+    def start_profiling(self):
+        if self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def stop_profiling(self, limit=25):
+        """Stops cProfile and returns the top functions by cumulative time as text."""
+        if self._profiler is None:
+            return ""
+        self._profiler.disable()
+        output = io.StringIO()
+        pstats.Stats(self._profiler, stream=output).sort_stats("cumulative").print_stats(limit)
+        self._profiler = None
+        return output.getvalue()
+
+    @property
+    def tracking_memory(self):
+        return tracemalloc.is_tracing()
+
+    def start_memory_tracking(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop_memory_tracking(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def memory(self):
+        """Current/peak traced Python memory in bytes, or None when tracemalloc is off."""
+        if not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        return {"current_bytes": current, "peak_bytes": peak}
+
+    def export_trace(self, path, extra=None):
+        """Writes the recorded events as a Chrome/Perfetto JSON trace plus a summary."""
+        pid = os.getpid()
+        trace_events = [{"name": name, "ph": "X", "pid": pid, "tid": thread_id,
+                         "ts": (start_ns - self._origin_ns) / 1000, "dur": (end_ns - start_ns) / 1000}
+                        for name, start_ns, end_ns, thread_id in self.events]
+        document = {"traceEvents": trace_events, "displayTimeUnit": "ms",
+                    "summary": self.summary(), "memory": self.memory()}
+        if extra:
+            document.update(extra)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(document, file)
+        return len(trace_events)
+
+
+# Process-wide instance used by @instrumented
+perf = Instrumentation()
+
+
+def instrumented(name):
+    """Decorator timing every call of the wrapped function under name (when perf.enabled)."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not perf.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                perf.record(name, start, time.perf_counter_ns())
+        return wrapper
+    return decorate
@@ -0,0 +1,288 @@
+"""
+Tests for the headless core: each structure is driven with random operations
+and compared against a brute-force model. Run with `python -m pytest`.
+"""
+from datetime import date, timedelta
+import json
+import random
+import statistics
+
+import pytest
+
+from scholex_core import (GradeStats, History, Item, ItemKind, ItemStorage, OrganizerCore, ProfileManager, Recurrence,
+                          SortedKeyList, item_row, iter_item_chunks, parse_recurrence)
+
+CATEGORIES = ("Exam", "Quiz", "Lab", "General")
+
+
+# --- SortedKeyList ---
+def test_sorted_key_list_matches_sorted_list(monkeypatch):
+    monkeypatch.setattr(SortedKeyList, "LOAD", 4) # Small buckets so splits and merges happen
+    rng = random.Random(11)
+    keys = SortedKeyList()
+    model = []
+    for _ in range(3000):
+        if model and rng.random() < 0.4:
+            key = rng.choice(model)
+            keys.remove(key)
+            model.remove(key)
+        else:
+            key = rng.randrange(10_000)
+            if key in model:
+                continue
+            keys.add(key)
+            model.append(key)
+        model.sort()
+
+        assert len(keys) == len(model)
+        probe = rng.randrange(10_001)
+        position = keys.bisect_left(probe)
+        assert position == sum(1 for key in model if key < probe)
+        if model:
+            index = rng.randrange(len(model))
+            assert keys[index] == model[index]
+            assert list(keys.iter_from(index)) == model[index:]
+    assert list(keys) == model
+
+
+def test_sorted_key_list_rejects_missing_key():
+    keys = SortedKeyList()
+    keys.add(3)
+    with pytest.raises(ValueError):
+        keys.remove(4)
+    with pytest.raises(IndexError):
+        keys[1]
+
+
+# --- GradeStats ---
+def test_grade_stats_add_and_remove_match_recomputation():
+    rng = random.Random(7)
+    stats = GradeStats()
+    model = []
+    for _ in range(2000):
+        if model and rng.random() < 0.45:
+            score, category = model.pop(rng.randrange(len(model)))
+            stats.remove(score, category)
+        else:
+            score, category = round(rng.uniform(0, 100), 1), rng.choice(CATEGORIES)
+            stats.add(score, category)
+            model.append((score, category))
+
+        scores = [score for score, _ in model]
+        assert stats.count == len(model)
+        if not model:
+            assert stats.std_dev is None and stats.minimum is None
+            continue
+        assert stats.mean == pytest.approx(statistics.fmean(scores))
+        assert stats.std_dev ** 2 == pytest.approx(statistics.pvariance(scores), abs=1e-6)
+        assert stats.sorted_scores == sorted(scores)
+        by_category = {}
+        for score, category in model:
+            totals = by_category.setdefault(category, [0.0, 0])
+            totals[0] += score
+            totals[1] += 1
+        assert stats.by_category.keys() == by_category.keys()
+        for category, (total, count) in by_category.items():
+            assert stats.by_category[category][0] == pytest.approx(total)
+            assert stats.by_category[category][1] == count
+
+
+# --- History ---
+def _state(core):
+    return {item.id: item_row(item) for item in core.all_items()}
+
+
+def _random_step(core, rng):
+    items = core.all_items()
+    action = rng.random()
+    if not items or action < 0.45:
+        if rng.random() < 0.5:
+            core.add("Grade", f"grade {rng.randrange(1000)}", score=str(rng.randrange(101)),
+                     category=rng.choice(CATEGORIES), term="Fall 2025")
+        else:
+            core.add(rng.choice(("Assignment", "Exam")), f"task {rng.randrange(1000)}",
+                     month=str(rng.randint(1, 12)), day=str(rng.randint(1, 28)))
+    elif action < 0.75:
+        item = rng.choice(items)
+        if item.kind is ItemKind.GRADE:
+            core.modify([item.id], score=str(rng.randrange(101)))
+        else:
+            core.modify([item.id], name=f"renamed {rng.randrange(1000)}")
+    else:
+        core.delete(rng.sample([item.id for item in items], k=min(len(items), rng.randint(1, 3))))
+
+
+def test_history_undo_and_redo_walk_back_through_folded_steps():
+    rng = random.Random(3)
+    core = OrganizerCore()
+    states = [_state(core)]
+    for _ in range(260): # Well past RECENT_LIMIT, so older steps get folded into snapshots
+        _random_step(core, rng)
+        states.append(_state(core))
+    assert len(core.history.undo_stack) < len(states) - 1
+
+    # Every undo lands on an earlier state (a folded snapshot skips several at once)
+    while core.undo() is not None:
+        assert _state(core) in states
+    assert _state(core) == states[0]
+    assert core.grade_stats.count == 0
+
+    while core.redo() is not None:
+        pass
+    assert _state(core) == states[-1]
+    scores = sorted(row[3] for row in states[-1].values() if row[3] is not None)
+    assert core.grade_stats.sorted_scores == scores
+
+
+def test_undone_delete_returns_to_its_place():
+    core = OrganizerCore()
+    ids = [core.add("Grade", f"grade {index}", score="90").id for index in range(5)]
+    core.delete([ids[1], ids[3]])
+    core.undo()
+    assert [item.id for item in core.query(ItemKind.GRADE)] == ids
+    assert [item.id for item in core.all_items()] == ids
+
+
+def test_grouped_steps_stay_within_row_limit(monkeypatch):
+    monkeypatch.setattr(History, "ROW_LIMIT", 100)
+    history = History()
+    history.record("add", {0: (None, "row")})
+    group = object()
+    for chunk in range(30): # An import adding 10 rows per chunk
+        history.record("import", {chunk * 10 + offset + 1: (None, "row") for offset in range(10)}, group)
+        assert history.rows <= History.ROW_LIMIT
+    assert not history.undo_stack # The whole import is no longer undoable, not just its tail
+
+
+# --- Recurrence ---
+def test_repeating_items_filter_and_sort_by_next_occurrence():
+    rng = random.Random(9)
+    today = date(2026, 10, 17)
+    core = OrganizerCore()
+    for index in range(200):
+        due = today + timedelta(days=rng.randint(-90, 30))
+        recurrence = None
+        if rng.random() < 0.5:
+            until = due + timedelta(days=rng.randint(0, 120)) if rng.random() < 0.5 else None
+            recurrence = Recurrence(rng.randint(1, 14), until)
+        core.add_items([Item(ItemKind.ASSIGNMENT, f"task {index}", due=due, recurrence=recurrence)])
+
+    def next_due(item): # Brute force: walk the whole series
+        days = [item.due]
+        if item.recurrence is not None:
+            days = list(item.recurrence.occurrences(item.due, item.due, date(2030, 1, 1)))
+        return next((day for day in days if day >= today), days[-1])
+
+    items = core.all_items()
+    expected = {
+        "All": sorted(items, key=lambda item: (next_due(item), item.id)),
+        "Upcoming": [item for item in items if today <= next_due(item) <= today + timedelta(days=7)],
+        "Overdue": [item for item in items if next_due(item) < today],
+    }
+    for name, wanted in expected.items():
+        wanted = sorted(wanted, key=lambda item: (next_due(item), item.id))
+        assert list(core.query(ItemKind.ASSIGNMENT, filter=name, sort=True, today=today)) == wanted
+        assert core.query(ItemKind.ASSIGNMENT, search="task", filter=name, sort=True, today=today) == wanted
+
+
+def test_until_month_day_is_the_first_such_date_on_or_after_due():
+    due = date(2026, 11, 1)
+    assert parse_recurrence("7", "01/10", due).until == date(2027, 1, 10)
+    assert parse_recurrence("7", "11/01", due).until == due
+    assert parse_recurrence("7", "02/29", due).until == date(2028, 2, 29)
+
+
+def test_moving_a_repeating_item_past_its_end_date_is_rejected():
+    core = OrganizerCore()
+    item = Item(ItemKind.ASSIGNMENT, "Lab log", due=date(2026, 10, 20), recurrence=Recurrence(7, date(2026, 11, 10)))
+    core.add_items([item])
+    with pytest.raises(ValueError, match="on or after the due date"):
+        core.modify([item.id], month="12", day="1")
+    # What the form sends back for the selected item: the stored end date, unchanged
+    with pytest.raises(ValueError, match="on or after the due date"):
+        core.modify([item.id], month="12", day="1", repeat="7", until=item.recurrence.until.isoformat())
+    assert item.recurrence.until == date(2026, 11, 10)
+    ended = Recurrence(7, date(2026, 11, 10))
+    assert ended.next_on_or_after(date(2026, 12, 1), date(2027, 1, 1)) == date(2026, 12, 1)
+
+
+def test_sorted_views_stay_lazy_with_repeating_items():
+    today = date(2026, 10, 17)
+    core = OrganizerCore()
+    core.add_items([Item(ItemKind.EXAM, f"exam {index}", due=today + timedelta(days=index % 40 - 20))
+                    for index in range(2000)])
+    core.add_items([Item(ItemKind.EXAM, "weekly quiz", due=today - timedelta(days=30), recurrence=Recurrence(7))])
+    view = core.query(ItemKind.EXAM, sort=True, today=today)
+    assert not isinstance(view, list)
+    assert len(view) == 2001
+
+
+# --- Import ---
+def test_import_reads_csv_with_byte_order_mark(tmp_path):
+    path = tmp_path / "items.csv"
+    path.write_text("kind,name,due\nAssignment,Essay,2026-11-02\n", encoding="utf-8-sig")
+    items, errors, _ = next(iter_item_chunks(path))
+    assert errors == []
+    assert [(item.name, item.due) for item in items] == [("Essay", date(2026, 11, 2))]
+
+
+# --- Storage journal ---
+def test_journal_replay_restores_unsnapshotted_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(ItemStorage, "IDLE_DELAY", 60) # Keep every change in the journal only
+    rng = random.Random(5)
+    path = tmp_path / "items.db"
+    storage = ItemStorage(path)
+    model = {}
+    for step in range(400):
+        if model and rng.random() < 0.3:
+            item_id = rng.choice(list(model))
+            storage.delete(item_id)
+            del model[item_id]
+        else:
+            item = Item(ItemKind.GRADE, f"grade {step}", score=float(rng.randrange(101)),
+                        category=rng.choice(CATEGORIES), term="Spring 2026")
+            if model and rng.random() < 0.3:
+                item.id = rng.choice(list(model)) # Overwrite an existing item
+            storage.save(item)
+            model[item.id] = item_row(item)
+    storage.flush()
+
+    # Simulate a crash: reopen while the first writer never snapshotted, with a torn last line
+    with open(storage.journal_path, "ab") as journal:
+        journal.write(json.dumps([999_999, None])[:-3].encode("utf-8"))
+    recovered = ItemStorage(path)
+    try:
+        assert recovered.recovered >= len(model) # Deleted IDs count as replayed changes too
+        assert {item.id: item_row(item) for item in recovered.load()} == model
+        assert storage.journal_path.stat().st_size == 0
+    finally:
+        recovered.close()
+        storage.close()
+
+
+def test_failed_journal_append_keeps_the_batch(tmp_path, monkeypatch):
+    def fail(self, changes):
+        raise OSError("disk full")
+    monkeypatch.setattr(ItemStorage, "_append_journal", fail)
+    storage = ItemStorage(tmp_path / "items.db")
+    item = Item(ItemKind.GRADE, "quiz", score=80.0)
+    storage.save(item)
+    storage.flush()
+    assert isinstance(storage.error, OSError)
+    storage.close()
+    reopened = ItemStorage(tmp_path / "items.db")
+    assert [stored.id for stored in reopened.load()] == [item.id]
+    reopened.close()
+
+
+# --- Profiles ---
+def test_profile_manager_keeps_at_most_max_loaded_profiles(tmp_path):
+    profiles = ProfileManager(tmp_path / "default.db", tmp_path / "profiles", max_loaded=2)
+    try:
+        for name in ("Student", "Ana", "Ben"):
+            profiles.add(name, profiles.load(name))
+            profiles.activate(name)
+        assert list(profiles.loaded) == ["Ana", "Ben"]
+        assert profiles.estimated_bytes() == 2 * ProfileManager.PROFILE_BYTES
+    finally:
+        profiles.close()